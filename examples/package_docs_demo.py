@@ -4,9 +4,13 @@ Demonstration of Typst Universe package documentation tools.
 
 This script shows how to use the package documentation features
 to discover, explore, and fetch documentation for Typst packages.
+
+The network-bound demos are fetched concurrently (the package_docs helpers
+are synchronous, so each one runs in a worker thread) and printed in order
+once all of them have completed.
 """
 
-import json
+import asyncio
 from typst_mcp.package_docs import (
     search_packages,
     get_package_versions,
@@ -14,13 +18,17 @@ from typst_mcp.package_docs import (
 )
 
 
-def demo_search():
+async def demo_search():
     """Demo: Search for packages related to plotting."""
+    return await asyncio.to_thread(search_packages, "plot", max_results=5)
+
+
+def print_search(results):
+    """Print the results of demo_search()."""
     print("\n" + "=" * 60)
     print("DEMO 1: Search for plotting packages")
     print("=" * 60)
 
-    results = search_packages("plot", max_results=5)
     print(f"\nFound {len(results)} packages matching 'plot':")
     for pkg in results:
         print(f"\n  📦 {pkg['name']}")
@@ -28,27 +36,34 @@ def demo_search():
         print(f"     URL: {pkg['url']}")
 
 
-def demo_versions():
+async def demo_versions():
     """Demo: Get versions for a specific package."""
+    return await asyncio.to_thread(get_package_versions, "cetz")
+
+
+def print_versions(versions):
+    """Print the results of demo_versions()."""
     print("\n" + "=" * 60)
     print("DEMO 2: Get versions for 'cetz' package")
     print("=" * 60)
 
-    versions = get_package_versions("cetz")
     print(f"\n📋 Available versions ({len(versions)} total):")
     print(f"   Latest: {versions[0]}")
     print(f"   Oldest: {versions[-1]}")
     print(f"   Recent releases: {', '.join(versions[:5])}")
 
 
-def demo_package_docs():
+async def demo_package_docs():
     """Demo: Fetch complete documentation for a package."""
+    return await asyncio.to_thread(build_package_docs, "cetz")
+
+
+def print_package_docs(docs):
+    """Print the results of demo_package_docs()."""
     print("\n" + "=" * 60)
     print("DEMO 3: Fetch documentation for 'cetz' package")
     print("=" * 60)
 
-    docs = build_package_docs("cetz")
-
     print(f"\n📖 Package Documentation:")
     print(f"   Name: {docs['package']}")
     print(f"   Version: {docs['version']}")
@@ -85,14 +100,25 @@ def demo_error_handling():
         print(f"\n✅ Error was handled gracefully!")
 
 
+async def main_async():
+    """Run the network-bound demos concurrently and print them in order."""
+    results, versions, docs = await asyncio.gather(
+        demo_search(),
+        demo_versions(),
+        demo_package_docs(),
+    )
+
+    print_search(results)
+    print_versions(versions)
+    print_package_docs(docs)
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 70)
     print(" " * 15 + "TYPST PACKAGE DOCUMENTATION DEMO")
     print("=" * 70)
 
-    demo_search()
-    demo_versions()
-    demo_package_docs()
+    asyncio.run(main_async())
     demo_error_handling()
 
     print("\n" + "=" * 70)
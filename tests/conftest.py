@@ -0,0 +1,9 @@
+"""Shared test setup."""
+
+import os
+import tempfile
+
+# Keep every cache the package creates out of the user's cache directory.
+# This must happen before typst_mcp is imported: get_cache_dir() is
+# computed once per process.
+os.environ["TYPST_MCP_CACHE_DIR"] = tempfile.mkdtemp(prefix="typst-mcp-tests-")
@@ -0,0 +1,368 @@
+"""Tests for the security checks and caches in typst_mcp.package_docs."""
+
+import threading
+import time
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from typst_mcp import package_docs as pd
+
+
+# =============================================================================
+# SSRF Protection
+# =============================================================================
+
+@pytest.mark.parametrize("url", [
+    "https://api.github.com/repos/typst/packages/contents/packages/preview",
+    "https://raw.githubusercontent.com/typst/packages/main/README.md",
+    "https://packages.typst.org/preview/cetz-0.3.0.tar.gz",
+    "https://objects.githubusercontent.com/some/blob",
+    "https://example.com/",
+    "https://8.8.8.8/",
+    "https://[2606:4700:4700::1111]/",
+])
+def test_is_safe_url_allows_public_hosts(url):
+    assert pd.is_safe_url(url)
+
+
+@pytest.mark.parametrize("url", [
+    # Local and metadata hostnames
+    "http://localhost/",
+    "http://LOCALHOST:8080/",
+    "http://localhost.localdomain/",
+    "http://metadata.google.internal/computeMetadata/v1/",
+    "http://metadata/",
+    # Blocked IPv4 ranges
+    "http://0.0.0.0/",
+    "http://10.1.2.3/",
+    "http://100.64.0.1/",
+    "http://127.0.0.1/",
+    "http://127.255.255.254/",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://172.16.0.1/",
+    "http://172.31.255.255/",
+    "http://192.0.0.8/",
+    "http://192.0.2.1/",
+    "http://192.168.1.1/",
+    "http://198.18.0.1/",
+    "http://198.51.100.7/",
+    "http://203.0.113.9/",
+    "http://224.0.0.1/",
+    "http://255.255.255.255/",
+    # Shorthand IPv4 forms that resolvers accept
+    "http://127.1/",
+    "http://0x7f000001/",
+    "http://2130706433/",
+    # IPv6
+    "http://[::1]/",
+    "http://[fe80::1]/",
+    "http://[fc00::1]/",
+    "http://[ff02::1]/",
+    "http://[::ffff:127.0.0.1]/",
+    "http://[::ffff:169.254.169.254]/",
+    # Userinfo does not hide the real host
+    "http://user:pw@127.0.0.1/",
+    # No host at all
+    "file:///etc/passwd",
+])
+def test_is_safe_url_blocks_local_and_reserved_hosts(url):
+    assert not pd.is_safe_url(url)
+
+
+@pytest.mark.parametrize("url, allowed", [
+    ("https://raw.githubusercontent.com/typst/packages/main/x", True),
+    ("https://objects.githubusercontent.com/x", True),
+    ("https://codeload.github.com/typst/packages/tar.gz/main", True),
+    ("https://example.com/", False),
+    ("https://github.com.evil.example/", False),
+    ("https://evilgithub.com/", False),
+    ("http://127.0.0.1/", False),
+])
+def test_is_safe_redirect_only_allows_known_hosts(url, allowed):
+    assert pd.is_safe_redirect(url) is allowed
+
+
+def test_safe_transport_rejects_unsafe_urls():
+    transport = pd.SSRFSafeTransport(httpx.MockTransport(lambda request: httpx.Response(200)))
+    with httpx.Client(transport=transport) as client:
+        assert client.get("https://api.github.com/").status_code == 200
+        with pytest.raises(ValueError, match="SSRF protection"):
+            client.get("http://169.254.169.254/latest/meta-data/")
+
+
+# =============================================================================
+# Input Validation
+# =============================================================================
+
+@pytest.mark.parametrize("name", ["cetz", "my-package", "a", "0x", "a" * 100])
+def test_validate_package_name_accepts(name):
+    assert pd.validate_package_name(name) == name
+
+
+@pytest.mark.parametrize("name", [
+    "",
+    "Cetz",
+    "-cetz",
+    "my_package",
+    "my.package",
+    "../cetz",
+    "cetz/..",
+    "cetz\\x",
+    "cetz\n",
+    "cetz ",
+    "a" * 101,
+])
+def test_validate_package_name_rejects(name):
+    with pytest.raises(ValueError):
+        pd.validate_package_name(name)
+
+
+@pytest.mark.parametrize("version", ["0.1.0", "1.10.100", "1.0.0-beta.1", "2.0.0-rc1"])
+def test_validate_version_accepts(version):
+    assert pd.validate_version(version) == version
+
+
+@pytest.mark.parametrize("version", [
+    "",
+    "1.0",
+    "1.0.0.0",
+    "v1.0.0",
+    "1.0.0-",
+    "1.0.0-Beta",
+    "1.0.0-..",
+    "1.0.0-a..b",
+    "1.0.0/..",
+    "1.0.0\\..",
+    "1.0.0\n",
+])
+def test_validate_version_rejects(version):
+    with pytest.raises(ValueError):
+        pd.validate_version(version)
+
+
+@pytest.mark.parametrize("path", [
+    "README.md",
+    "examples/plot.typ",
+    "docs/guide.v2.md",
+    "src/..hidden",
+    "a..b/c.typ",
+])
+def test_validate_file_path_accepts(path):
+    assert pd.validate_file_path(path) == path
+
+
+@pytest.mark.parametrize("path", [
+    "/etc/passwd",
+    "\\windows\\system32",
+    "..",
+    "../typst.toml",
+    "examples/../../secret",
+    "examples\\..\\secret",
+    "examples/..",
+    "README.md\x00.typ",
+    "a" * 501,
+])
+def test_validate_file_path_rejects(path):
+    with pytest.raises(ValueError):
+        pd.validate_file_path(path)
+
+
+# =============================================================================
+# Version Ordering
+# =============================================================================
+
+def test_version_key_orders_by_semver_precedence():
+    ordered = [
+        "not-a-version",
+        "0.9.0",
+        "0.10.0",
+        "1.0.0-alpha",
+        "1.0.0-alpha.1",
+        "1.0.0-alpha.beta",
+        "1.0.0-beta",
+        "1.0.0-beta.2",
+        "1.0.0-beta.11",
+        "1.0.0-rc.1",
+        "1.0.0",
+        "1.2.0",
+        "10.0.0",
+    ]
+    shuffled = ordered[::2] + ordered[1::2]
+    assert sorted(shuffled, key=pd._version_key) == ordered
+
+
+# =============================================================================
+# Build Deduplication
+# =============================================================================
+
+@pytest.fixture
+def package_cache(monkeypatch):
+    """Give each test an empty in-memory package cache."""
+    monkeypatch.setattr(pd, "_package_cache", OrderedDict())
+    monkeypatch.setattr(pd, "_inflight_builds", {})
+
+
+def _run_concurrently(target, count):
+    results = [None] * count
+    errors = []
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_build_once_runs_concurrent_builds_once(package_cache):
+    builds = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.2)
+        return {"package": "x"}
+
+    results, errors = _run_concurrently(lambda: pd._build_once("x@1.0.0", build, 5), 8)
+
+    assert not errors
+    assert len(builds) == 1
+    assert all(result is results[0] for result in results)
+    assert pd._cache_get("x@1.0.0") is results[0]
+
+
+def test_build_once_waiters_retry_after_failed_build(package_cache):
+    builds = []
+    started = threading.Event()
+
+    def build():
+        builds.append(1)
+        if len(builds) == 1:
+            started.set()
+            time.sleep(0.2)
+            raise RuntimeError("first build fails")
+        return {"package": "x"}
+
+    errors = []
+
+    def first_caller():
+        try:
+            pd._build_once("x@1.0.0", build, 5)
+        except RuntimeError as e:
+            errors.append(e)
+
+    first = threading.Thread(target=first_caller)
+    first.start()
+    started.wait(5)
+    docs = pd._build_once("x@1.0.0", build, 5)
+    first.join()
+
+    assert docs == {"package": "x"}
+    assert len(builds) == 2
+    assert [str(e) for e in errors] == ["first build fails"]
+
+
+# =============================================================================
+# HTTP Cache
+# =============================================================================
+
+@pytest.fixture
+def http_server(monkeypatch, tmp_path):
+    """
+    Route the shared client to a mock server with empty HTTP caches.
+
+    Yields a dict whose "handler" entry answers requests; every request is
+    appended to its "requests" list.
+    """
+    server = {"requests": [], "handler": None}
+
+    def handle(request):
+        server["requests"].append(request)
+        return server["handler"](request)
+
+    transport = pd.SSRFSafeTransport(httpx.MockTransport(handle))
+    monkeypatch.setattr(pd, "_safe_client", httpx.Client(transport=transport))
+    monkeypatch.setattr(pd, "get_http_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(pd, "_http_memory_cache", OrderedDict())
+    monkeypatch.setattr(pd, "_http_memory_bytes", 0)
+    monkeypatch.setattr(pd, "_http_not_found", OrderedDict())
+    monkeypatch.setattr(pd, "_http_inflight", {})
+    yield server
+    pd._safe_client.close()
+
+
+URL = "https://api.github.com/repos/typst/packages/contents/packages/preview/x"
+
+
+def test_conditional_get_reuses_body_on_304(http_server):
+    body = [{"name": "1.0.0", "type": "dir"}]
+
+    def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, json=body, headers={"etag": '"v1"'})
+
+    http_server["handler"] = handler
+
+    # ttl=0 and max_stale=0 make every lookup revalidate inline
+    assert pd._get_cached(URL, ttl=0, max_stale=0) == body
+    assert pd._get_cached(URL, ttl=0, max_stale=0) == body
+
+    first, second = http_server["requests"]
+    assert "if-none-match" not in first.headers
+    assert second.headers["if-none-match"] == '"v1"'
+
+
+def test_fresh_entry_is_served_without_request(http_server):
+    http_server["handler"] = lambda request: httpx.Response(200, json={"a": 1})
+
+    assert pd._get_cached(URL) == {"a": 1}
+    assert pd._get_cached(URL) == {"a": 1}
+    assert len(http_server["requests"]) == 1
+
+
+def test_entry_survives_memory_eviction_on_disk(http_server):
+    http_server["handler"] = lambda request: httpx.Response(200, json={"a": 1})
+
+    assert pd._get_cached(URL) == {"a": 1}
+    pd._http_memory_cache.clear()
+    assert pd._get_cached(URL) == {"a": 1}
+    assert len(http_server["requests"]) == 1
+
+
+def test_404_is_remembered(http_server):
+    http_server["handler"] = lambda request: httpx.Response(404)
+
+    assert pd._get_cached(URL) is None
+    assert pd._get_cached(URL) is None
+    assert len(http_server["requests"]) == 1
+
+
+def test_404_drops_cached_entry(http_server):
+    http_server["handler"] = lambda request: httpx.Response(200, json={"a": 1})
+    assert pd._get_cached(URL, ttl=0, max_stale=0) == {"a": 1}
+
+    http_server["handler"] = lambda request: httpx.Response(404)
+    assert pd._get_cached(URL, ttl=0, max_stale=0) is None
+
+    assert URL not in pd._http_memory_cache
+    assert not pd._http_cache_file(URL).exists()
+
+
+def test_memory_tier_is_bounded_by_bytes(http_server, monkeypatch):
+    monkeypatch.setattr(pd, "HTTP_MEMORY_CACHE_MAX_BYTES", 1000)
+
+    pd._remember_http_entry("a", {"data": "a" * 600})
+    pd._remember_http_entry("b", {"data": "b" * 300})
+    pd._remember_http_entry("c", {"data": "c" * 300})  # evicts "a"
+    pd._remember_http_entry("d", {"data": "d" * 2000})  # larger than the budget
+
+    assert list(pd._http_memory_cache) == ["b", "c"]
+    assert pd._http_memory_bytes == 600
@@ -5,7 +5,23 @@ import subprocess
 import sys
 import shutil
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
+
+import httpx
+
+
+# GitHub API endpoint for the latest commit on typst's main branch
+TYPST_HEAD_API_URL = "https://api.github.com/repos/typst/typst/commits/main"
+
+# Anonymous API requests are limited to 60/hr; a token (GITHUB_TOKEN or
+# GH_TOKEN) raises that to 5000/hr. It is only ever sent to the API host.
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+GITHUB_API_ACCEPT = "application/vnd.github+json"
 
 
 def eprint(*args, **kwargs):
@@ -13,10 +29,13 @@ def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
+@lru_cache(maxsize=1)
 def get_cache_dir():
     """Get the cache directory for typst-mcp data.
 
     Can be configured via TYPST_MCP_CACHE_DIR environment variable.
+    The result is computed once per process (the environment and the
+    directory are not expected to change while the server runs).
     """
     # Check for environment variable first
     env_cache = os.environ.get("TYPST_MCP_CACHE_DIR")
@@ -38,8 +57,42 @@ def get_cache_dir():
     return cache_dir
 
 
+def get_github_token() -> Optional[str]:
+    """Get the optional GitHub API token from GITHUB_TOKEN or GH_TOKEN."""
+    return os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+
+
+class GitHubAuth(httpx.Auth):
+    """
+    Attach GitHub API headers to requests for the GitHub API host.
+
+    SECURITY: The token is added per request and only when the target is
+    api.github.com, so it is never sent to raw content hosts or
+    packages.typst.org. httpx strips the Authorization header on redirects
+    to another origin.
+    """
+
+    def __init__(self, token: Optional[str] = None):
+        self._token = token
+
+    def auth_flow(self, request: httpx.Request):
+        if request.url.host == GITHUB_API_HOST:
+            # Replace httpx's "*/*" default, keep media types set by callers
+            if request.headers.get("Accept", "*/*") == "*/*":
+                request.headers["Accept"] = GITHUB_API_ACCEPT
+            request.headers["X-GitHub-Api-Version"] = GITHUB_API_VERSION
+            if self._token:
+                request.headers["Authorization"] = f"Bearer {self._token}"
+        yield request
+
+
+@lru_cache(maxsize=1)
 def check_cargo_installed():
-    """Check if cargo is installed and meets minimum version requirements."""
+    """Check if cargo is installed and meets minimum version requirements.
+
+    The result is cached for the lifetime of the process, so the rustc
+    subprocess is only spawned once.
+    """
     if shutil.which("cargo") is None:
         eprint("ERROR: cargo is not installed. Please install Rust toolchain from https://rustup.rs/")
         return False
@@ -76,8 +129,50 @@ def check_cargo_installed():
     return True
 
 
+def _read_git_head(repo_path: Path) -> str:
+    """Resolve HEAD by reading the repository's .git files directly.
+
+    Handles detached HEADs, loose refs and packed-refs. Returns an empty
+    string if HEAD cannot be resolved this way (e.g. worktrees or other
+    layouts), in which case callers should fall back to git itself.
+    """
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return ""
+
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD holds the commit hash itself
+
+    ref = head[len("ref: "):]
+    try:
+        return (git_dir / ref).read_text().strip()
+    except OSError:
+        pass
+
+    try:
+        with open(git_dir / "packed-refs", "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        pass
+
+    return ""
+
+
 def get_repo_commit_hash(repo_path: Path) -> str:
-    """Get the current git commit hash of a repository."""
+    """Get the current git commit hash of a repository.
+
+    Reads the hash from the .git directory when possible to avoid spawning
+    a git process on every startup, falling back to `git rev-parse HEAD`.
+    """
+    commit_hash = _read_git_head(repo_path)
+    if commit_hash:
+        return commit_hash
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -141,30 +236,127 @@ def save_version(cache_dir: Path, typst_repo: Path):
         eprint(f"✓ Saved version: {commit_hash[:8]}")
 
 
-def update_typst_repo(typst_repo: Path) -> bool:
-    """Update the typst repository to the latest version."""
-    if (typst_repo / ".git").exists():
-        eprint("Checking for Typst updates...")
-        try:
-            # Fetch latest changes
-            subprocess.run(
-                ["git", "fetch", "origin", "main"],
-                cwd=typst_repo,
-                capture_output=True,
-                check=True
-            )
-            # Reset to latest
-            subprocess.run(
-                ["git", "reset", "--hard", "origin/main"],
-                cwd=typst_repo,
-                capture_output=True,
-                check=True
-            )
-            eprint("✓ Typst repository updated to latest version")
-            return True
-        except subprocess.CalledProcessError as e:
-            eprint(f"Warning: Could not update typst repo: {e.stderr}")
-            return False
+def check_typst_remote(etag_file: Path) -> Tuple[bool, str]:
+    """Check whether typst's main branch moved since the last update.
+
+    Sends a conditional HEAD request to the GitHub API using the ETag saved
+    after the previous successful update. A 304 response means the local
+    checkout is already at the latest commit and `git fetch` can be skipped.
+
+    Args:
+        etag_file: File holding the ETag of the last fetched main commit
+
+    Returns:
+        Tuple of (unchanged, etag). `etag` is the current ETag to save once
+        the update succeeds, or "" if it could not be determined.
+    """
+    try:
+        saved_etag = etag_file.read_text().strip()
+    except OSError:
+        saved_etag = ""
+
+    headers = {"User-Agent": "typst-mcp"}
+    if saved_etag:
+        headers["If-None-Match"] = saved_etag
+
+    try:
+        response = httpx.head(
+            TYPST_HEAD_API_URL,
+            headers=headers,
+            auth=GitHubAuth(get_github_token()),
+            timeout=5,
+        )
+    except httpx.HTTPError as e:
+        eprint(f"Warning: Could not check for Typst updates: {e}")
+        return False, ""
+
+    if response.status_code == 304:
+        return True, saved_etag
+
+    if response.status_code != 200:
+        return False, ""
+
+    return False, response.headers.get("etag", "")
+
+
+def fetch_typst_repo(typst_repo: Path) -> bool:
+    """Fetch the latest typst main branch without touching the working tree."""
+    try:
+        subprocess.run(
+            ["git", "fetch", "origin", "main"],
+            cwd=typst_repo,
+            capture_output=True,
+            check=True
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        eprint(f"Warning: Could not update typst repo: {e.stderr}")
+        return False
+
+
+def reset_typst_repo(typst_repo: Path) -> bool:
+    """Reset the typst working tree to the fetched origin/main."""
+    try:
+        subprocess.run(
+            ["git", "reset", "--hard", "origin/main"],
+            cwd=typst_repo,
+            capture_output=True,
+            check=True
+        )
+        eprint("✓ Typst repository updated to latest version")
+        return True
+    except subprocess.CalledProcessError as e:
+        eprint(f"Warning: Could not update typst repo: {e.stderr}")
+        return False
+
+
+def prefetch_cargo_deps(typst_repo: Path) -> bool:
+    """Download crates for the checked-out Cargo.lock (best effort)."""
+    try:
+        subprocess.run(
+            ["cargo", "fetch", "--manifest-path", str(typst_repo / "Cargo.toml")],
+            capture_output=True,
+            check=True
+        )
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        eprint(f"Warning: cargo fetch failed, crates will be fetched during build: {e}")
+        return False
+
+
+def update_typst_repo(typst_repo: Path, etag_file: Path) -> bool:
+    """Update the typst repository to the latest version.
+
+    Skips `git fetch` when GitHub reports that main has not moved since the
+    last successful update, and saves the new ETag after updating.
+
+    Args:
+        typst_repo: Path to the typst checkout
+        etag_file: File holding the ETag of the last fetched main commit
+
+    Returns:
+        True if the checkout is up to date, False if the update failed
+    """
+    if not (typst_repo / ".git").exists():
+        return True
+
+    eprint("Checking for Typst updates...")
+    unchanged, etag = check_typst_remote(etag_file)
+    if unchanged:
+        eprint("✓ Typst repository is already at the latest version")
+        return True
+
+    # The git fetch and cargo's crate download for the current lockfile are
+    # independent network-bound steps, so run them concurrently; the reset
+    # only happens once both are done so cargo never sees a half-updated tree.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        git_fetch = executor.submit(fetch_typst_repo, typst_repo)
+        executor.submit(prefetch_cargo_deps, typst_repo)
+    if not (git_fetch.result() and reset_typst_repo(typst_repo)):
+        return False
+
+    if etag:
+        etag_file.write_text(etag)
     return True
 
 
@@ -180,7 +372,8 @@ def build_typst_docs():
     eprint(f"Docs directory: {docs_dir}")
     eprint(f"Typst repo: {typst_repo}")
 
-    # Check if rebuild is needed
+    # Check if rebuild is needed. This must stay ahead of the cargo/rustc
+    # checks so that warm starts with cached docs never spawn the toolchain.
     if not needs_rebuild(cache_dir, typst_repo):
         eprint("✓ Typst docs are up to date")
         eprint(f"  Location: {docs_json}")
@@ -194,9 +387,15 @@ def build_typst_docs():
     if not check_cargo_installed():
         return False
 
+    # ETag of typst's main branch as of the last successful clone or update
+    etag_file = cache_dir / ".typst-head.etag"
+
     # Ensure typst repository is cloned
     if not (typst_repo / "Cargo.toml").exists():
         eprint("Cloning typst repository (this may take a moment)...")
+        # Probe before cloning: if main moves in between, the saved ETag is
+        # older than the checkout and the next start just fetches again
+        _, etag = check_typst_remote(etag_file)
         try:
             subprocess.run(
                 ["git", "clone", "--depth=1", "https://github.com/typst/typst.git", str(typst_repo)],
@@ -205,6 +404,8 @@ def build_typst_docs():
                 text=True
             )
             eprint("✓ Typst repository cloned")
+            if etag:
+                etag_file.write_text(etag)
         except subprocess.CalledProcessError as e:
             eprint(f"ERROR: Failed to clone repository: {e.stderr}")
             return False
@@ -213,7 +414,7 @@ def build_typst_docs():
             return False
     else:
         # Update existing repository to latest version
-        update_typst_repo(typst_repo)
+        update_typst_repo(typst_repo, etag_file)
 
     # Create docs directory
     docs_dir.mkdir(parents=True, exist_ok=True)
@@ -222,8 +423,11 @@ def build_typst_docs():
     eprint("Generating Typst documentation (this may take 30-60 seconds)...")
     eprint("Running: cargo run --package typst-docs ...")
 
+    # Stream cargo output line by line instead of buffering the whole build
+    # log; only the tail is kept for error reporting.
+    tail = deque(maxlen=200)
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [
                 "cargo", "run",
                 "--manifest-path", str(typst_repo / "Cargo.toml"),
@@ -232,21 +436,32 @@ def build_typst_docs():
                 "--assets-dir", str(docs_dir),
                 "--out-file", str(docs_json)
             ],
-            check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
         )
-        eprint("✓ Typst documentation generated successfully")
-        eprint(f"  Output: {docs_json}")
+        with proc:
+            for line in proc.stdout:
+                tail.append(line)
+                eprint(line, end="")
+        returncode = proc.wait()
+    except FileNotFoundError as e:
+        eprint(f"ERROR: Failed to generate docs: {e}")
+        return False
 
-        # Save version for future checks
-        save_version(cache_dir, typst_repo)
+    if returncode != 0:
+        eprint(f"ERROR: Failed to generate docs (exit code {returncode}):")
+        eprint("".join(tail), end="")
+        return False
 
-        return True
+    eprint("✓ Typst documentation generated successfully")
+    eprint(f"  Output: {docs_json}")
 
-    except subprocess.CalledProcessError as e:
-        eprint(f"ERROR: Failed to generate docs: {e.stderr}")
-        return False
+    # Save version for future checks
+    save_version(cache_dir, typst_repo)
+
+    return True
 
 
 def main():
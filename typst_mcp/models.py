@@ -44,6 +44,20 @@ MAX_SNIPPET_LENGTH = 100_000  # 100KB for code snippets
 MAX_LATEX_SNIPPET_LENGTH = 50_000  # 50KB for LaTeX (Pandoc can be slow)
 MAX_QUERY_LENGTH = 500  # 500 chars for search queries
 MAX_RESULTS = 1000  # Maximum search results
+MAX_PACKAGE_FILES = 100  # Maximum files per get_package_files call
+
+# Package identifiers, as Field patterns (pydantic's regex engine, where "$"
+# only matches at the very end of the input)
+PACKAGE_NAME_PATTERN = r"^[a-z0-9][a-z0-9-]*$"
+VERSION_PATTERN = r"^[0-9]+\.[0-9]+\.[0-9]+(-[a-z0-9.]+)?$"
+
+# The same patterns for runtime validators, unanchored: use them with
+# fullmatch(). (Python's "$" would also match before a trailing newline.)
+PACKAGE_NAME_RE = re.compile(r"[a-z0-9][a-z0-9-]*")
+VERSION_RE = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+(-[a-z0-9.]+)?")
+
+# Path traversal ("..") or absolute paths in package file paths, in one pass
+_BAD_PATH_RE = re.compile(r"\.\.|^[/\\]")
 
 # Timeouts
 DEFAULT_VALIDATION_TIMEOUT = 30  # seconds
@@ -241,12 +255,12 @@ class PackageDocsParams(BaseModel):
         description="Package name (e.g., 'cetz', 'tidy')",
         min_length=1,
         max_length=100,
-        pattern=r"^[a-z0-9][a-z0-9-]*$",
+        pattern=PACKAGE_NAME_PATTERN,
     )
     version: str | None = Field(
         None,
         description="Package version (semver, e.g., '0.2.2')",
-        pattern=r"^[0-9]+\.[0-9]+\.[0-9]+(-[a-z0-9.]+)?$",
+        pattern=VERSION_PATTERN,
     )
     summary: bool = Field(
         default=False, description="Return lightweight summary instead of full docs"
@@ -261,12 +275,12 @@ class PackageFileParams(BaseModel):
         description="Package name",
         min_length=1,
         max_length=100,
-        pattern=r"^[a-z0-9][a-z0-9-]*$",
+        pattern=PACKAGE_NAME_PATTERN,
     )
     version: str = Field(
         ...,
         description="Package version (semver)",
-        pattern=r"^[0-9]+\.[0-9]+\.[0-9]+(-[a-z0-9.]+)?$",
+        pattern=VERSION_PATTERN,
     )
     file_path: str = Field(
         ..., description="File path within package (e.g., 'examples/basic.typ')"
@@ -276,11 +290,43 @@ class PackageFileParams(BaseModel):
     @classmethod
     def validate_file_path(cls, v: str) -> str:
         """Validate file path to prevent path traversal."""
-        if ".." in v or v.startswith("/"):
+        if _BAD_PATH_RE.search(v):
             raise ValueError("Invalid file path: path traversal detected")
         return v
 
 
+class PackageFilesParams(BaseModel):
+    """Parameters for get_package_files tool."""
+
+    package_name: str = Field(
+        ...,
+        description="Package name",
+        min_length=1,
+        max_length=100,
+        pattern=PACKAGE_NAME_PATTERN,
+    )
+    version: str = Field(
+        ...,
+        description="Package version (semver)",
+        pattern=VERSION_PATTERN,
+    )
+    file_paths: list[str] = Field(
+        ...,
+        description="File paths within package (e.g., ['examples/basic.typ', 'README.md'])",
+        min_length=1,
+        max_length=MAX_PACKAGE_FILES,
+    )
+
+    @field_validator("file_paths")
+    @classmethod
+    def validate_file_paths(cls, v: list[str]) -> list[str]:
+        """Validate each file path to prevent path traversal."""
+        for path in v:
+            if _BAD_PATH_RE.search(path):
+                raise ValueError(f"Invalid file path: path traversal detected in '{path}'")
+        return v
+
+
 class SearchPackagesParams(BaseModel):
     """Parameters for search_packages tool."""
 
@@ -1,17 +1,31 @@
 #!/usr/bin/env python3
 """Module for fetching and caching Typst Universe package documentation."""
 
-import json
+import atexit
+import hashlib
+import io
+import os
 import re
+import socket
+import string
 import sys
+import tarfile
+import tempfile
+import threading
 import time
+import tomllib
 import ipaddress
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from urllib.parse import urlparse
 import httpx
-import toml
-from .build_docs import get_cache_dir, eprint
+import orjson
+from .build_docs import get_cache_dir, eprint, get_github_token, GitHubAuth
+from .models import PACKAGE_NAME_RE, VERSION_RE
 
 
 # =============================================================================
@@ -21,6 +35,89 @@ from .build_docs import get_cache_dir, eprint
 
 MAX_RESPONSE_SIZE = 10 * 1024 * 1024  # 10MB - Maximum total response size
 MAX_FILE_SIZE = 1 * 1024 * 1024       # 1MB - Maximum single file size
+READ_CHUNK_SIZE = 64 * 1024           # 64KB - Bodies are read (and size-checked) in chunks
+
+
+# =============================================================================
+# HTTP Metadata Cache
+# =============================================================================
+# GitHub API listings (package versions, directory contents) change rarely.
+# They are cached on disk together with their ETag so that repeated lookups
+# are served locally, and stale entries are revalidated with a conditional GET.
+
+HTTP_CACHE_TTL = 60 * 60  # 1 hour - Serve cached listings without revalidation
+HTTP_CACHE_MAX_STALE = 24 * 60 * 60  # 24 hours - Serve stale listings while refreshing in background
+PACKAGE_TREE_TTL = float("inf")  # Published package versions are immutable
+UNIVERSE_LISTING_TTL = 5 * 60  # 5 minutes - New packages are published continuously
+HTTP_MEMORY_CACHE_MAX_ENTRIES = 256  # Entries also kept in memory (LRU)
+HTTP_MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32MB - Body bytes kept in memory; raw files can be large
+HTTP_NEGATIVE_TTL = 10 * 60  # 10 minutes - Remember 404s so bad names don't hit GitHub again
+HTTP_NEGATIVE_MAX_ENTRIES = 256  # Remembered 404s (LRU)
+
+# User-Agent sent with every request (GitHub's API rejects requests without one)
+USER_AGENT = "typst-mcp"
+
+# Connection pool for the shared client: keep connections to GitHub warm
+# between tool calls and allow enough parallel fetches per package build
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=60,
+)
+
+# Connecting, sending and waiting for a pooled connection should be quick;
+# only reading the response gets the caller's timeout
+HTTP_CONNECT_TIMEOUT = 5.0
+
+# Concurrent fetches per process (TYPST_MCP_PACKAGE_DOCS_CONCURRENCY).
+# Bounded so large packages don't trip GitHub's secondary rate limits.
+DEFAULT_FETCH_CONCURRENCY = 8
+MAX_FETCH_CONCURRENCY = 32
+
+
+# =============================================================================
+# Package Source URLs
+# =============================================================================
+# Every URL fetched or linked for a package, in one place (str.format templates)
+
+PACKAGES_CONTENTS_URL = "https://api.github.com/repos/typst/packages/contents/packages/preview"
+PACKAGE_VERSIONS_URL = PACKAGES_CONTENTS_URL + "/{package}"
+PACKAGE_CONTENTS_URL = PACKAGES_CONTENTS_URL + "/{package}/{version}/{path}"
+PACKAGE_TREE_URL = (
+    "https://api.github.com/repos/typst/packages/git/trees/"
+    "main:packages/preview/{package}/{version}?recursive=1"
+)
+PACKAGE_RAW_URL = (
+    "https://raw.githubusercontent.com/typst/packages/main/packages/preview/"
+    "{package}/{version}/{path}"
+)
+PACKAGE_TARBALL_URL = "https://packages.typst.org/preview/{package}-{version}.tar.gz"
+PACKAGE_GITHUB_URL = "https://github.com/typst/packages/tree/main/packages/preview/{package}/{version}"
+UNIVERSE_PACKAGE_URL = "https://typst.app/universe/package/{package}/"
+
+
+# =============================================================================
+# Package File Candidates
+# =============================================================================
+# Conventional names probed (in order) for a package's top-level documents
+
+README_CANDIDATES = ("README.md", "readme.md", "Readme.md")
+LICENSE_CANDIDATES = ("LICENSE", "LICENSE.md", "LICENSE.txt")
+CHANGELOG_CANDIDATES = ("CHANGELOG.md", "CHANGELOG", "changelog.md", "HISTORY.md")
+
+# File extensions collected from the examples/ and docs/ directories
+EXAMPLE_EXTENSIONS = (".typ",)
+DOCS_EXTENSIONS = (".md", ".txt", ".typ")
+
+# Packages warmed by prefetch_packages() when prefetching is enabled
+POPULAR_PACKAGES = ("cetz", "fletcher", "polylux", "codly", "tablex")
+
+# Length of the README preview returned in package summaries
+README_PREVIEW_CHARS = 500
+
+# Package builds needing at least this many uncached files download the
+# package archive once instead of fetching the files one by one
+PACKAGE_ARCHIVE_MIN_FILES = 8
 
 
 # =============================================================================
@@ -38,6 +135,166 @@ ALLOWED_REDIRECT_HOSTS = frozenset([
     "objects.githubusercontent.com",  # GitHub raw content CDN
 ])
 
+# Dotted suffixes for subdomain matching, checked in one str.endswith() call
+_ALLOWED_REDIRECT_SUFFIXES = tuple(f".{host}" for host in ALLOWED_REDIRECT_HOSTS)
+
+
+# Hostnames of the local machine and of cloud metadata services
+BLOCKED_HOSTNAMES = frozenset([
+    "localhost",
+    "localhost.localdomain",
+    "127.0.0.1",
+    "::1",
+    "0.0.0.0",
+    "metadata.google.internal",  # GCP metadata
+    "metadata.google.com",
+    "metadata",
+])
+
+
+# Blocked IPv4 ranges, checked as integer (network, mask) pairs. This is a
+# superset of what ipaddress classifies as private, loopback, link-local,
+# reserved or multicast, plus carrier-grade NAT space.
+_BLOCKED_IPV4_RANGES = (
+    ("0.0.0.0/8", "Reserved IP range"),
+    ("10.0.0.0/8", "Private IP address"),
+    ("100.64.0.0/10", "Shared (carrier-grade NAT) address"),
+    ("127.0.0.0/8", "Loopback address"),
+    ("169.254.0.0/16", "Link-local address (metadata endpoint)"),
+    ("172.16.0.0/12", "Private IP address"),
+    ("192.0.0.0/24", "Reserved IP range"),
+    ("192.0.2.0/24", "Reserved IP range"),
+    ("192.168.0.0/16", "Private IP address"),
+    ("198.18.0.0/15", "Reserved IP range"),
+    ("198.51.100.0/24", "Reserved IP range"),
+    ("203.0.113.0/24", "Reserved IP range"),
+    ("224.0.0.0/4", "Multicast address"),
+    ("240.0.0.0/4", "Reserved IP range"),  # Includes 255.255.255.255
+)
+_BLOCKED_IPV4_NETWORKS = tuple(
+    (int(network.network_address), int(network.netmask), reason)
+    for network, reason in (
+        (ipaddress.IPv4Network(cidr), reason) for cidr, reason in _BLOCKED_IPV4_RANGES
+    )
+)
+
+
+# First octets that fall into at least one blocked range. Public addresses
+# mostly start with an octet not listed here and skip the range scan.
+_IPV4_FIRST_OCTET_BLOCKED = bytes(
+    any((octet << 24) & mask & 0xFF000000 == network & 0xFF000000
+        for network, mask, _ in _BLOCKED_IPV4_NETWORKS)
+    for octet in range(256)
+)
+
+
+def _unsafe_ipv4_reason(address: int) -> Optional[str]:
+    """Check an IPv4 address (as an integer) against the blocked ranges."""
+    if not _IPV4_FIRST_OCTET_BLOCKED[address >> 24]:
+        return None
+    for network, mask, reason in _BLOCKED_IPV4_NETWORKS:
+        if address & mask == network:
+            return f"{reason}: {socket.inet_ntoa(address.to_bytes(4, 'big'))}"
+    return None
+
+
+# Requests go to a handful of hosts, so the per-host checks below are
+# memoized; they are pure functions of the (lowercased) hostname.
+
+@lru_cache(maxsize=2048)
+def _is_allowed_redirect_host(hostname: str) -> bool:
+    """Check a lowercased hostname against ALLOWED_REDIRECT_HOSTS (including subdomains)."""
+    # Direct match, or subdomain match (e.g., "objects.githubusercontent.com")
+    return (
+        hostname in ALLOWED_REDIRECT_HOSTS
+        or hostname.endswith(_ALLOWED_REDIRECT_SUFFIXES)
+    )
+
+
+@lru_cache(maxsize=2048)
+def _unsafe_host_reason(hostname: str) -> Optional[str]:
+    """
+    Check a lowercased hostname against the SSRF blocklist.
+
+    Args:
+        hostname: Lowercased hostname or IP literal
+
+    Returns:
+        Why the host is blocked, or None if it is safe to fetch from
+    """
+    # Block localhost and common local hostnames
+    if hostname in BLOCKED_HOSTNAMES:
+        return f"Localhost/metadata hostname: {hostname}"
+
+    # Known-good hosts (every URL this module builds) need no IP parsing
+    if _is_allowed_redirect_host(hostname):
+        return None
+
+    if ":" not in hostname:
+        # IPv4 literal? inet_aton() also accepts the shorthand forms that
+        # resolvers accept (e.g. "127.1", "0x7f000001")
+        try:
+            packed = socket.inet_aton(hostname)
+        except OSError:
+            # Not an IP address, it's a hostname - continue with hostname check
+            return None
+        return _unsafe_ipv4_reason(int.from_bytes(packed, "big"))
+
+    # IPv6 literal
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        return f"Unparseable IPv6 address: {hostname}"
+
+    # IPv4-mapped addresses (::ffff:a.b.c.d) reach the IPv4 host
+    if ip.ipv4_mapped:
+        return _unsafe_ipv4_reason(int(ip.ipv4_mapped))
+
+    # Block private addresses
+    if ip.is_private:
+        return f"Private IP address: {ip}"
+
+    # Block loopback
+    if ip.is_loopback:
+        return f"Loopback address: {ip}"
+
+    # Block link-local
+    if ip.is_link_local:
+        return f"Link-local address: {ip}"
+
+    # Block reserved ranges
+    if ip.is_reserved:
+        return f"Reserved IP range: {ip}"
+
+    # Block multicast
+    if ip.is_multicast:
+        return f"Multicast address: {ip}"
+
+    return None
+
+
+# Plain "http(s)://host[:port]" URLs, which is every URL this module builds.
+# The host (and optional numeric port) must be followed by a path, query,
+# fragment or the end, so userinfo ("user:pw@127.0.0.1"), IPv6 literals and
+# unusual characters never match and go through urlparse() instead.
+_URL_HOST_RE = re.compile(
+    r"https?://([a-z0-9.-]+)(?=(?::[0-9]*)?(?:[/?#]|\Z))", re.IGNORECASE
+)
+
+
+def _url_hostname(url: str) -> Optional[str]:
+    """
+    Extract the lowercased hostname of a URL.
+
+    Raises:
+        ValueError: If the URL cannot be parsed
+    """
+    match = _URL_HOST_RE.match(url)
+    if match:
+        return match.group(1).lower()
+    # urlparse() lowercases the hostname
+    return urlparse(url).hostname
+
 
 def is_safe_url(url: str) -> bool:
     """
@@ -56,66 +313,21 @@ def is_safe_url(url: str) -> bool:
         True if URL is safe to fetch, False otherwise
     """
     try:
-        parsed = urlparse(url)
-        hostname = parsed.hostname
-
-        if not hostname:
-            return False
-
-        # Block localhost and common local hostnames
-        blocked_hostnames = {
-            "localhost",
-            "localhost.localdomain",
-            "127.0.0.1",
-            "::1",
-            "0.0.0.0",
-            "metadata.google.internal",  # GCP metadata
-            "metadata.google.com",
-            "metadata",
-        }
-        if hostname.lower() in blocked_hostnames:
-            eprint(f"SSRF BLOCKED: Localhost/metadata hostname: {hostname}")
-            return False
-
-        # Try to parse as IP address
-        try:
-            ip = ipaddress.ip_address(hostname)
-
-            # Block private addresses
-            if ip.is_private:
-                eprint(f"SSRF BLOCKED: Private IP address: {ip}")
-                return False
-
-            # Block loopback
-            if ip.is_loopback:
-                eprint(f"SSRF BLOCKED: Loopback address: {ip}")
-                return False
-
-            # Block link-local (including AWS/GCP metadata: 169.254.169.254)
-            if ip.is_link_local:
-                eprint(f"SSRF BLOCKED: Link-local address (metadata endpoint): {ip}")
-                return False
-
-            # Block reserved ranges
-            if ip.is_reserved:
-                eprint(f"SSRF BLOCKED: Reserved IP range: {ip}")
-                return False
-
-            # Block multicast
-            if ip.is_multicast:
-                eprint(f"SSRF BLOCKED: Multicast address: {ip}")
-                return False
-
-        except ValueError:
-            # Not an IP address, it's a hostname - continue with hostname check
-            pass
-
-        return True
-
+        hostname = _url_hostname(url)
     except Exception as e:
         eprint(f"SSRF BLOCKED: Error parsing URL '{url}': {e}")
         return False
 
+    if not hostname:
+        return False
+
+    reason = _unsafe_host_reason(hostname)
+    if reason:
+        eprint(f"SSRF BLOCKED: {reason}")
+        return False
+
+    return True
+
 
 def is_safe_redirect(url: str) -> bool:
     """
@@ -135,31 +347,20 @@ def is_safe_redirect(url: str) -> bool:
         return False
 
     try:
-        parsed = urlparse(url)
-        hostname = parsed.hostname
-
-        if not hostname:
-            return False
-
-        # Check if hostname is in allowed list
-        hostname_lower = hostname.lower()
-
-        # Direct match
-        if hostname_lower in ALLOWED_REDIRECT_HOSTS:
-            return True
-
-        # Check for subdomain match (e.g., "objects.githubusercontent.com")
-        for allowed in ALLOWED_REDIRECT_HOSTS:
-            if hostname_lower.endswith(f".{allowed}"):
-                return True
-
-        eprint(f"SSRF BLOCKED: Redirect to unknown host: {hostname}")
-        return False
-
+        hostname = _url_hostname(url)
     except Exception as e:
         eprint(f"SSRF BLOCKED: Error checking redirect '{url}': {e}")
         return False
 
+    if not hostname:
+        return False
+
+    if _is_allowed_redirect_host(hostname):
+        return True
+
+    eprint(f"SSRF BLOCKED: Redirect to unknown host: {hostname}")
+    return False
+
 
 class SSRFSafeTransport(httpx.BaseTransport):
     """
@@ -182,6 +383,29 @@ class SSRFSafeTransport(httpx.BaseTransport):
         return self._wrapped.handle_request(request)
 
 
+class GitHubRateLimitError(RuntimeError):
+    """Raised when GitHub rejects a request because the rate limit is exhausted."""
+
+    def __init__(self, reset_at: Optional[int] = None):
+        self.reset_at = reset_at
+        message = "GitHub API rate limit exceeded"
+        if reset_at:
+            wait = max(0, reset_at - int(time.time()))
+            message += f" (resets in {wait}s)"
+        message += "; set GITHUB_TOKEN to raise the limit"
+        super().__init__(message)
+
+
+def _make_timeout(timeout: float) -> httpx.Timeout:
+    """Build a timeout that bounds the read phase by ``timeout`` seconds."""
+    return httpx.Timeout(
+        timeout,
+        connect=HTTP_CONNECT_TIMEOUT,
+        write=HTTP_CONNECT_TIMEOUT,
+        pool=HTTP_CONNECT_TIMEOUT,
+    )
+
+
 def create_safe_client(timeout: int = 10, max_redirects: int = 5) -> httpx.Client:
     """
     Create an HTTP client with SSRF protection and redirect validation.
@@ -191,6 +415,7 @@ def create_safe_client(timeout: int = 10, max_redirects: int = 5) -> httpx.Clien
     - Validates redirect targets against allowlist
     - Limits number of redirects
     - Sets reasonable timeouts
+    - Sends the GitHub token (if configured) only to the GitHub API
 
     Args:
         timeout: Request timeout in seconds
@@ -199,8 +424,9 @@ def create_safe_client(timeout: int = 10, max_redirects: int = 5) -> httpx.Clien
     Returns:
         Configured httpx.Client
     """
-    # Create base transport with redirect validation
-    base_transport = httpx.HTTPTransport()
+    # Create base transport with redirect validation. HTTP/2 lets concurrent
+    # requests to the same host share a single TLS connection.
+    base_transport = httpx.HTTPTransport(http2=True, limits=HTTP_POOL_LIMITS)
 
     # Custom event hook to validate redirects
     def validate_redirect(response: httpx.Response) -> None:
@@ -216,7 +442,9 @@ def create_safe_client(timeout: int = 10, max_redirects: int = 5) -> httpx.Clien
                     raise ValueError(f"SSRF protection: Blocked redirect to: {redirect_url}")
 
     return httpx.Client(
-        timeout=timeout,
+        timeout=_make_timeout(timeout),
+        headers={"User-Agent": USER_AGENT},
+        auth=GitHubAuth(get_github_token()),
         follow_redirects=True,
         max_redirects=max_redirects,
         event_hooks={"response": [validate_redirect]},
@@ -224,16 +452,70 @@ def create_safe_client(timeout: int = 10, max_redirects: int = 5) -> httpx.Clien
     )
 
 
+# Shared client state (created lazily on first use, closed at exit)
+_safe_client: Optional[httpx.Client] = None
+_safe_client_lock = threading.Lock()
+
+
+def _fetch_concurrency() -> int:
+    """
+    Get the number of concurrent fetch workers.
+
+    Read from TYPST_MCP_PACKAGE_DOCS_CONCURRENCY, clamped to
+    1..MAX_FETCH_CONCURRENCY; invalid values fall back to the default.
+    """
+    value = os.environ.get("TYPST_MCP_PACKAGE_DOCS_CONCURRENCY")
+    if not value:
+        return DEFAULT_FETCH_CONCURRENCY
+    try:
+        return min(max(int(value), 1), MAX_FETCH_CONCURRENCY)
+    except ValueError:
+        eprint(f"Warning: Invalid TYPST_MCP_PACKAGE_DOCS_CONCURRENCY {value!r}, "
+               f"using {DEFAULT_FETCH_CONCURRENCY}")
+        return DEFAULT_FETCH_CONCURRENCY
+
+
+# Worker pool for concurrent leaf fetches (single files, listings, previews).
+# Its size caps the requests in flight to GitHub at any time.
+# Tasks running here must not submit and wait on further tasks themselves,
+# otherwise nested waits could exhaust the pool and deadlock.
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=_fetch_concurrency(), thread_name_prefix="typst-mcp-fetch"
+)
+
+
+def get_safe_client() -> httpx.Client:
+    """
+    Get the process-wide SSRF-safe HTTP client.
+
+    Reusing one client keeps connections alive across calls, so repeated
+    requests to GitHub skip the TCP and TLS handshakes. httpx clients are
+    thread-safe, so the client can be shared by worker threads.
+
+    Returns:
+        Shared httpx.Client created by create_safe_client()
+    """
+    global _safe_client
+    if _safe_client is None:
+        with _safe_client_lock:
+            if _safe_client is None:
+                _safe_client = create_safe_client()
+                atexit.register(_safe_client.close)
+    return _safe_client
+
+
 def fetch_with_size_limit(
     client: httpx.Client,
     url: str,
-    max_size: int = MAX_FILE_SIZE
+    max_size: int = MAX_FILE_SIZE,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Any = httpx.USE_CLIENT_DEFAULT
 ) -> httpx.Response:
     """
     Fetch URL content with size limit protection.
 
     SECURITY: This function:
-    - Optionally checks Content-Length header before downloading
+    - Checks the Content-Length header before reading the body
     - Streams response and aborts if size limit exceeded
     - Prevents memory exhaustion attacks
 
@@ -241,54 +523,150 @@ def fetch_with_size_limit(
         client: HTTP client to use
         url: URL to fetch
         max_size: Maximum response size in bytes
+        headers: Optional extra request headers (e.g. If-None-Match)
+        timeout: Per-request timeout in seconds (defaults to the client's)
 
     Returns:
         httpx.Response object
 
     Raises:
         ValueError: If response exceeds size limit
+        GitHubRateLimitError: If the GitHub API rate limit is exhausted
         httpx.HTTPError: If request fails
     """
-    # First, try a HEAD request to check Content-Length
-    try:
-        head_response = client.head(url)
-        content_length = head_response.headers.get("content-length")
-        if content_length:
+    if isinstance(timeout, (int, float)):
+        timeout = _make_timeout(timeout)
+
+    # Stream the response and check size as we read, so memory stays bounded
+    # by max_size plus one chunk even if the server ignores Content-Length
+    with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+        # Surface GitHub rate limiting as a typed error rather than a bare 403
+        if (
+            response.status_code in (403, 429)
+            and response.headers.get("x-ratelimit-remaining") == "0"
+        ):
+            reset = response.headers.get("x-ratelimit-reset", "")
+            raise GitHubRateLimitError(int(reset) if reset.isdigit() else None)
+
+        # Refuse early when the server announces an oversized body
+        content_length = response.headers.get("content-length")
+        if content_length and content_length.isdigit():
             size = int(content_length)
             if size > max_size:
                 raise ValueError(
                     f"Response too large: {size} bytes exceeds limit of {max_size} bytes"
                 )
-    except (httpx.HTTPError, ValueError):
-        # HEAD request failed or no Content-Length - continue with GET
-        pass
 
-    # Stream the response and check size as we read
-    response = client.get(url)
-
-    # Check actual content length
-    content_length = response.headers.get("content-length")
-    if content_length:
-        size = int(content_length)
-        if size > max_size:
-            raise ValueError(
-                f"Response too large: {size} bytes exceeds limit of {max_size} bytes"
-            )
-
-    # Also check actual content size
-    content = response.content
-    if len(content) > max_size:
-        raise ValueError(
-            f"Response content too large: {len(content)} bytes exceeds limit of {max_size} bytes"
-        )
+        # Also check actual content size (decoded bytes, which also bounds
+        # compressed responses that inflate past the limit)
+        chunks = []
+        received = 0
+        for chunk in response.iter_bytes(READ_CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_size:
+                raise ValueError(
+                    f"Response content too large: exceeds limit of {max_size} bytes"
+                )
+            chunks.append(chunk)
+
+    # Return a buffered copy so .content/.text/.json() work after the stream
+    # closes. The body is already decoded, so the wire encoding and length
+    # headers no longer apply (httpx sets Content-Length from the body).
+    headers = response.headers.copy()
+    headers.pop("content-encoding", None)
+    headers.pop("content-length", None)
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=b"".join(chunks),
+        request=response.request,
+    )
+
+
+# Package cache state (LRU-bounded: full docs can be several MB each)
+PACKAGE_CACHE_MAX_ENTRIES = 64
+_package_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_package_cache_lock = threading.Lock()
+
+
+def _cache_get(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Get docs from the in-memory cache, marking them as recently used."""
+    with _package_cache_lock:
+        docs = _package_cache.get(cache_key)
+        if docs is not None:
+            _package_cache.move_to_end(cache_key)
+        return docs
+
+
+def _cache_put(cache_key: str, docs: Dict[str, Any]) -> None:
+    """Store docs in the in-memory cache, evicting the least recently used."""
+    with _package_cache_lock:
+        _package_cache[cache_key] = docs
+        _package_cache.move_to_end(cache_key)
+        while len(_package_cache) > PACKAGE_CACHE_MAX_ENTRIES:
+            _package_cache.popitem(last=False)
+
+
+# Builds in progress, keyed by "name@version": concurrent requests for the
+# same package wait for the first build instead of repeating its fetches
+_inflight_builds: Dict[str, threading.Event] = {}
+_inflight_builds_lock = threading.Lock()
+
+
+def _build_once(cache_key: str, build: Any, wait_timeout: float) -> Dict[str, Any]:
+    """
+    Run ``build()`` for a cache key unless another thread is already doing so.
+
+    The first caller for a key runs the build and stores the result in the
+    in-memory cache; callers arriving meanwhile block until it finishes and
+    reuse that result. If the first build fails, waiters retry it themselves.
+
+    Args:
+        cache_key: In-memory cache key of the docs being built
+        build: Callable returning the docs
+        wait_timeout: Maximum seconds to wait for a concurrent build
+
+    Returns:
+        The built (or concurrently built) docs
+
+    Raises:
+        RuntimeError: If a concurrent build does not finish in time
+    """
+    while True:
+        with _inflight_builds_lock:
+            event = _inflight_builds.get(cache_key)
+            if event is None:
+                event = _inflight_builds[cache_key] = threading.Event()
+                break
+
+        if not event.wait(wait_timeout):
+            raise RuntimeError(f"Timed out waiting for concurrent build of {cache_key}")
+        docs = _cache_get(cache_key)
+        if docs is not None:
+            return docs
+
+    try:
+        docs = build()
+        _cache_put(cache_key, docs)
+        return docs
+    finally:
+        with _inflight_builds_lock:
+            del _inflight_builds[cache_key]
+        event.set()
+
 
-    return response
+# The validators below are pure functions called with the same few strings
+# for every file of a package build, so their results are memoized.
+# Invalid inputs raise and are therefore never cached.
 
+# Characters allowed in package names (see models.PACKAGE_NAME_PATTERN)
+_PACKAGE_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "-")
 
-# Package cache state
-_package_cache: Dict[str, Dict[str, Any]] = {}
+# A ".." path component, with "/" or "\\" as separator (one scan, no splitting)
+_TRAVERSAL_RE = re.compile(r"(?:^|[\\/])\.\.(?:[\\/]|\Z)")
 
 
+@lru_cache(maxsize=1024)
 def validate_package_name(name: str) -> str:
     """Validate package name to prevent path traversal and injection attacks.
 
@@ -301,25 +679,27 @@ def validate_package_name(name: str) -> str:
     Raises:
         ValueError: If package name is invalid or contains path traversal
     """
-    # Allow only lowercase letters, numbers, hyphens (standard package naming)
-    if not re.match(r'^[a-z0-9][a-z0-9-]*$', name):
+    # Reasonable length limit (checked first, it bounds the work below)
+    if len(name) > 100:
+        raise ValueError(f"Package name too long (max 100 characters): '{name}'")
+
+    # Allow only lowercase letters, numbers, hyphens (standard package naming).
+    # The character set alone excludes '.', '/' and '\\', so no separate
+    # path traversal check is needed.
+    if not (
+        _PACKAGE_NAME_CHARS.issuperset(name)
+        and PACKAGE_NAME_RE.fullmatch(name)
+    ):
         raise ValueError(
             f"Invalid package name format: '{name}'. "
             "Package names must start with a letter or number and contain only "
             "lowercase letters, numbers, and hyphens."
         )
 
-    # Additional safety checks for path traversal
-    if '..' in name or '/' in name or '\\' in name:
-        raise ValueError(f"Path traversal detected in package name: '{name}'")
-
-    # Reasonable length limit
-    if len(name) > 100:
-        raise ValueError(f"Package name too long (max 100 characters): '{name}'")
-
     return name
 
 
+@lru_cache(maxsize=1024)
 def validate_version(version: str) -> str:
     """Validate version string to prevent path traversal.
 
@@ -332,20 +712,22 @@ def validate_version(version: str) -> str:
     Raises:
         ValueError: If version is invalid or contains path traversal
     """
-    # Semantic versioning format: X.Y.Z or X.Y.Z-suffix
-    if not re.match(r'^[0-9]+\.[0-9]+\.[0-9]+(-[a-z0-9.]+)?$', version):
+    # Semantic versioning format: X.Y.Z or X.Y.Z-suffix. The character
+    # classes already exclude '/' and '\\'.
+    if not VERSION_RE.fullmatch(version):
         raise ValueError(
             f"Invalid version format: '{version}'. "
             "Version must follow semantic versioning (e.g., 1.0.0 or 1.0.0-beta.1)"
         )
 
-    # Path traversal check
-    if '..' in version or '/' in version or '\\' in version:
+    # Path traversal check (the suffix may contain '.', e.g. "1.0.0-..")
+    if '..' in version:
         raise ValueError(f"Path traversal detected in version: '{version}'")
 
     return version
 
 
+@lru_cache(maxsize=1024)
 def validate_file_path(path: str) -> str:
     """Validate file path within package to prevent path traversal.
 
@@ -362,10 +744,8 @@ def validate_file_path(path: str) -> str:
     if path.startswith('/') or path.startswith('\\'):
         raise ValueError(f"Absolute paths not allowed: '{path}'")
 
-    # Check for path traversal in normalized path
-    normalized = path.replace('\\', '/')
-    parts = normalized.split('/')
-    if '..' in parts:
+    # Check for path traversal: a ".." component with either separator
+    if _TRAVERSAL_RE.search(path):
         raise ValueError(f"Path traversal detected in file path: '{path}'")
 
     # Prevent null bytes (can bypass some security checks)
@@ -379,13 +759,474 @@ def validate_file_path(path: str) -> str:
     return path
 
 
+@lru_cache(maxsize=1)
 def get_package_cache_dir() -> Path:
-    """Get the cache directory for package documentation."""
+    """Get the cache directory for package documentation.
+
+    The directory is created on the first call only; later calls return
+    the remembered path without touching the filesystem.
+    """
     cache_dir = get_cache_dir() / "package-docs"
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
 
+@lru_cache(maxsize=1)
+def get_package_summary_cache_dir() -> Path:
+    """Get the cache directory for package summaries (created once).
+
+    Kept in a subdirectory so list_cached_packages() only sees full docs.
+    """
+    cache_dir = get_package_cache_dir() / "summaries"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def _read_json_file(path: Path) -> Any:
+    """Read and parse a JSON cache file."""
+    return orjson.loads(path.read_bytes())
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """Serialize data to a compact JSON cache file, replacing it atomically.
+
+    Concurrent readers never observe a partially written file, and each
+    writer gets its own temp file so concurrent writers never share one.
+    """
+    _write_file_atomic(path, orjson.dumps(data))
+
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a unique temp file in path's directory, then rename it over path."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
+def get_http_cache_dir() -> Path:
+    """Get the cache directory for conditional-GET HTTP responses (created once)."""
+    cache_dir = get_cache_dir() / "http-cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+@lru_cache(maxsize=1)
+def get_blob_cache_dir() -> Path:
+    """Get the cache directory for package files keyed by git blob SHA (created once).
+
+    Identical files (a LICENSE shared by many packages or versions) are
+    stored and fetched only once.
+    """
+    cache_dir = get_cache_dir() / "blob-cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+# Git blob SHA-1 as returned by the trees and contents APIs
+_BLOB_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA-1 of file contents."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+# HTTP cache state (LRU-bounded in-memory tier in front of the on-disk entries)
+_http_memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_http_memory_bytes = 0  # Total body size of the entries in _http_memory_cache
+_http_refreshing: set[str] = set()
+_http_inflight: Dict[str, Future] = {}  # URL -> revalidation in progress
+_http_not_found: "OrderedDict[str, float]" = OrderedDict()  # URL -> expiry time
+_http_cache_lock = threading.Lock()
+
+
+def _http_cache_file(url: str) -> Path:
+    """Get the on-disk cache file for a URL."""
+    return get_http_cache_dir() / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _http_entry_size(entry: Dict[str, Any]) -> int:
+    """Get the body size of a cache entry in bytes (counted once, then stored)."""
+    size = entry.get("size")
+    if size is None:
+        # Entries cached before sizes were recorded
+        data = entry.get("data")
+        body = data.encode("utf-8") if isinstance(data, str) else orjson.dumps(data)
+        size = entry["size"] = len(body)
+    return size
+
+
+def _forget_http_entry_locked(url: str) -> None:
+    """Drop an entry from the in-memory tier. Caller holds _http_cache_lock."""
+    global _http_memory_bytes
+    entry = _http_memory_cache.pop(url, None)
+    if entry is not None:
+        _http_memory_bytes -= _http_entry_size(entry)
+
+
+def _remember_http_entry(url: str, entry: Dict[str, Any]) -> None:
+    """
+    Keep an entry in the in-memory tier, evicting the least recently used.
+
+    The tier is bounded by entry count and by total body size. An entry
+    larger than the whole byte budget is only kept on disk.
+    """
+    global _http_memory_bytes
+    size = _http_entry_size(entry)
+    with _http_cache_lock:
+        _forget_http_entry_locked(url)
+        if size > HTTP_MEMORY_CACHE_MAX_BYTES:
+            return
+        _http_memory_cache[url] = entry
+        _http_memory_bytes += size
+        while (
+            len(_http_memory_cache) > HTTP_MEMORY_CACHE_MAX_ENTRIES
+            or _http_memory_bytes > HTTP_MEMORY_CACHE_MAX_BYTES
+        ):
+            _forget_http_entry_locked(next(iter(_http_memory_cache)))
+
+
+def _remember_not_found(url: str) -> None:
+    """Remember that a URL returned 404 for HTTP_NEGATIVE_TTL seconds."""
+    with _http_cache_lock:
+        _http_not_found[url] = time.time() + HTTP_NEGATIVE_TTL
+        _http_not_found.move_to_end(url)
+        while len(_http_not_found) > HTTP_NEGATIVE_MAX_ENTRIES:
+            _http_not_found.popitem(last=False)
+
+
+def _is_known_not_found(url: str) -> bool:
+    """Check whether a URL returned 404 recently."""
+    with _http_cache_lock:
+        expiry = _http_not_found.get(url)
+        if expiry is None:
+            return False
+        if expiry > time.time():
+            return True
+        del _http_not_found[url]
+        return False
+
+
+def _parse_max_age(cache_control: Optional[str]) -> Optional[int]:
+    """Extract max-age (seconds) from a Cache-Control header, if present."""
+    if not cache_control:
+        return None
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age" and value.isdigit():
+            return int(value)
+    return None
+
+
+def _load_http_entry(url: str) -> Optional[Dict[str, Any]]:
+    """Load a cached HTTP entry from memory, falling back to disk."""
+    with _http_cache_lock:
+        entry = _http_memory_cache.get(url)
+        if entry is not None:
+            _http_memory_cache.move_to_end(url)
+            return entry
+
+    cache_file = _http_cache_file(url)
+    if not cache_file.exists():
+        return None
+
+    try:
+        entry = _read_json_file(cache_file)
+    except orjson.JSONDecodeError as e:
+        eprint(f"Warning: Removing corrupt HTTP cache entry for {url}: {e}")
+        cache_file.unlink(missing_ok=True)
+        return None
+    except Exception as e:
+        eprint(f"Warning: Ignoring unreadable HTTP cache entry for {url}: {e}")
+        return None
+
+    _remember_http_entry(url, entry)
+    return entry
+
+
+def _revalidate_http_entry(
+    url: str,
+    entry: Optional[Dict[str, Any]],
+    timeout: int,
+    max_size: int,
+    as_text: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a URL (conditionally, if an entry exists) and store the result.
+
+    The body is stored parsed as JSON, or as text if ``as_text`` is set,
+    together with the ETag, Last-Modified and Cache-Control max-age
+    validators sent back on the next revalidation.
+
+    Returns:
+        The fresh cache entry, or None if the server returned 404
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response exceeds the size limit
+    """
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    # SECURITY: Use safe client with SSRF protection and size limits
+    response = fetch_with_size_limit(
+        get_safe_client(), url, max_size=max_size, headers=headers, timeout=timeout
+    )
+
+    if response.status_code == 404:
+        # The resource is gone; drop any stale copy
+        with _http_cache_lock:
+            _forget_http_entry_locked(url)
+        _http_cache_file(url).unlink(missing_ok=True)
+        _remember_not_found(url)
+        return None
+
+    max_age = _parse_max_age(response.headers.get("cache-control"))
+    if response.status_code == 304 and entry:
+        entry = {**entry, "fetched_at": time.time()}
+        if max_age is not None:
+            entry["max_age"] = max_age
+    else:
+        response.raise_for_status()
+        entry = {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "max_age": max_age,
+            "fetched_at": time.time(),
+            "size": len(response.content),
+            "data": response.text if as_text else orjson.loads(response.content),
+        }
+
+    _remember_http_entry(url, entry)
+    try:
+        _write_json_file(_http_cache_file(url), entry)
+    except OSError as e:
+        eprint(f"Warning: Could not write HTTP cache entry for {url}: {e}")
+
+    return entry
+
+
+def _refresh_http_entry_in_background(
+    url: str,
+    entry: Dict[str, Any],
+    timeout: int,
+    max_size: int,
+    as_text: bool = False
+) -> None:
+    """Revalidate a stale entry in a daemon thread (at most one per URL)."""
+    with _http_cache_lock:
+        if url in _http_refreshing:
+            return
+        _http_refreshing.add(url)
+
+    def refresh() -> None:
+        try:
+            _revalidate_http_entry(url, entry, timeout, max_size, as_text)
+        except Exception as e:
+            eprint(f"Warning: Background refresh failed for {url}: {e}")
+        finally:
+            with _http_cache_lock:
+                _http_refreshing.discard(url)
+
+    threading.Thread(target=refresh, daemon=True).start()
+
+
+def _revalidate_once(
+    url: str,
+    entry: Optional[Dict[str, Any]],
+    timeout: int,
+    max_size: int,
+    as_text: bool
+) -> Optional[Dict[str, Any]]:
+    """
+    Revalidate a URL unless another thread is already fetching it.
+
+    Concurrent misses for the same URL (two tool calls resolving the same
+    package, say) share one request: the first caller fetches, the others
+    wait for its result or exception.
+
+    Args:
+        url: URL to fetch
+        entry: Cached entry to revalidate, or None
+        timeout: Request timeout in seconds
+        max_size: Maximum response size in bytes
+        as_text: Cache the body as text instead of parsed JSON
+
+    Returns:
+        The updated cache entry, or None if the server returned 404
+    """
+    with _http_cache_lock:
+        future = _http_inflight.get(url)
+        owner = future is None
+        if owner:
+            future = _http_inflight[url] = Future()
+
+    if not owner:
+        # Report a wait that outlasts the timeout like a direct request timeout
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError as e:
+            raise httpx.TimeoutException(
+                f"Timed out waiting for a concurrent fetch of {url}"
+            ) from e
+
+    try:
+        result = _revalidate_http_entry(url, entry, timeout, max_size, as_text)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _http_cache_lock:
+            del _http_inflight[url]
+
+
+def _get_cached(
+    url: str,
+    timeout: int = 10,
+    ttl: Optional[float] = HTTP_CACHE_TTL,
+    max_size: int = MAX_RESPONSE_SIZE,
+    max_stale: float = HTTP_CACHE_MAX_STALE,
+    as_text: bool = False
+) -> Optional[Any]:
+    """
+    Fetch a URL, caching the body in memory and on disk keyed by URL.
+
+    Entries younger than ``ttl`` are returned without touching the network.
+    Entries up to ``max_stale`` seconds past their TTL are returned
+    immediately while a background thread revalidates them. Older entries
+    are revalidated inline with ``If-None-Match`` / ``If-Modified-Since``;
+    a 304 response refreshes the entry and the cached body is reused.
+    Concurrent fetches of the same URL share one request. A 404 is
+    remembered for HTTP_NEGATIVE_TTL seconds, so repeated lookups of
+    missing packages or files are answered without a request.
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        ttl: Seconds a cached entry is served without revalidation, or None
+            to use the max-age the server sent (HTTP_CACHE_TTL if it sent none)
+        max_size: Maximum response size in bytes
+        max_stale: Seconds past the TTL a stale entry may still be served
+        as_text: Cache the body as text instead of parsed JSON
+
+    Returns:
+        Parsed JSON document (or text), or None if the server returned 404
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response exceeds the size limit
+        GitHubRateLimitError: If rate limited and nothing is cached
+    """
+    if _is_known_not_found(url):
+        return None
+
+    entry = _load_http_entry(url)
+
+    if entry:
+        entry_ttl = ttl
+        if entry_ttl is None:
+            entry_ttl = entry.get("max_age")
+            if entry_ttl is None:
+                entry_ttl = HTTP_CACHE_TTL
+
+        age = time.time() - entry.get("fetched_at", 0)
+        if age < entry_ttl:
+            return entry["data"]
+        if age < entry_ttl + max_stale:
+            _refresh_http_entry_in_background(url, entry, timeout, max_size, as_text)
+            return entry["data"]
+
+    try:
+        entry = _revalidate_once(url, entry, timeout, max_size, as_text)
+    except GitHubRateLimitError:
+        # An old copy beats no answer until the rate limit resets
+        if entry:
+            eprint(f"Warning: Rate limited, serving stale cache entry for {url}")
+            return entry["data"]
+        raise
+    return entry["data"] if entry else None
+
+
+def _get_json_cached(
+    url: str,
+    timeout: int = 10,
+    ttl: Optional[float] = HTTP_CACHE_TTL,
+    max_size: int = MAX_RESPONSE_SIZE,
+    max_stale: float = HTTP_CACHE_MAX_STALE
+) -> Optional[Any]:
+    """Fetch and cache a JSON document (see _get_cached)."""
+    return _get_cached(url, timeout, ttl, max_size, max_stale)
+
+
+def _version_key(version: str) -> tuple:
+    """
+    Sort key ordering version strings by semver precedence.
+
+    Numeric parts compare as integers (so 0.10.0 > 0.9.0) and a pre-release
+    sorts below its release. Pre-release identifiers compare one by one:
+    numeric ones as integers (so beta.10 > beta.2) and below alphanumeric
+    ones, with a shorter run of equal identifiers sorting first. Names that
+    are not versions sort lowest.
+    """
+    if not VERSION_RE.fullmatch(version):
+        return (-1, version)
+    core, _, prerelease = version.partition("-")
+    major, minor, patch = core.split(".")
+    identifiers = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in prerelease.split(".")
+    ) if prerelease else ()
+    return (int(major), int(minor), int(patch), not prerelease, identifiers)
+
+
+def _list_package_versions(package_name: str, timeout: int = 10) -> list[str]:
+    """
+    Fetch the version directory names of a package from GitHub, unsorted.
+
+    Raises:
+        RuntimeError: If package not found or request fails
+        ValueError: If package_name contains invalid characters or path traversal
+    """
+    # SECURITY: Validate package name to prevent path traversal attacks
+    package_name = validate_package_name(package_name)
+
+    url = PACKAGE_VERSIONS_URL.format(package=package_name)
+
+    try:
+        contents = _get_json_cached(url, timeout=timeout)
+
+        if contents is None:
+            raise RuntimeError(f"Package '{package_name}' not found in Typst Universe")
+
+        # Extract version directories
+        return [
+            item["name"] for item in contents
+            if item["type"] == "dir"
+        ]
+
+    except GitHubRateLimitError:
+        raise
+    except httpx.TimeoutException:
+        raise RuntimeError(f"Timeout while fetching package versions for '{package_name}'")
+    except httpx.HTTPError as e:
+        raise RuntimeError(f"HTTP error while fetching package '{package_name}': {e}")
+    except Exception as e:
+        raise RuntimeError(f"Error fetching package '{package_name}': {e}")
+
+
 def get_package_versions(package_name: str, timeout: int = 10) -> list[str]:
     """
     Fetch available versions for a package from GitHub.
@@ -395,61 +1236,469 @@ def get_package_versions(package_name: str, timeout: int = 10) -> list[str]:
         timeout: Request timeout in seconds
 
     Returns:
-        List of available versions
+        List of available versions, latest first
 
     Raises:
         RuntimeError: If package not found or request fails
         ValueError: If package_name contains invalid characters or path traversal
     """
-    # SECURITY: Validate package name to prevent path traversal attacks
+    versions = _list_package_versions(package_name, timeout)
+    return sorted(versions, key=_version_key, reverse=True)  # Latest first
+
+
+def get_latest_version(package_name: str, timeout: int = 10) -> str:
+    """
+    Fetch the latest version of a package from GitHub.
+
+    Args:
+        package_name: Name of the package (e.g., "cetz")
+        timeout: Request timeout in seconds
+
+    Returns:
+        The highest available version
+
+    Raises:
+        RuntimeError: If package not found, has no versions, or request fails
+        ValueError: If package_name contains invalid characters or path traversal
+    """
+    versions = _list_package_versions(package_name, timeout)
+    if not versions:
+        raise RuntimeError(f"No versions found for package '{package_name}'")
+    return max(versions, key=_version_key)
+
+
+def _store_blob(sha: str, data: bytes, source: str) -> None:
+    """
+    Store file contents in the blob cache if they hash to the expected SHA.
+
+    Content that is not the listed blob (e.g. an LFS pointer) is never
+    cached under that SHA.
+    """
+    if _git_blob_sha(data) != sha:
+        eprint(f"Warning: Content of {source} does not match blob {sha}, not caching")
+        return
+
+    blob_file = get_blob_cache_dir() / sha
+    try:
+        _write_file_atomic(blob_file, data)
+    except OSError as e:
+        eprint(f"Warning: Could not write blob cache entry for {source}: {e}")
+
+
+def _fetch_blob(url: str, sha: str, timeout: int) -> Optional[str]:
+    """
+    Fetch a raw file whose git blob SHA is known, through the blob cache.
+
+    Blobs are immutable, so a cached copy is used without revalidation.
+    Fetched content is only stored if it hashes to the expected SHA.
+
+    Returns:
+        File content as string, or None if the server returned 404
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response exceeds the size limit
+    """
+    blob_file = get_blob_cache_dir() / sha
+    try:
+        return blob_file.read_bytes().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        pass
+
+    if _is_known_not_found(url):
+        return None
+
+    # SECURITY: Use safe client with SSRF protection and size limits
+    response = fetch_with_size_limit(
+        get_safe_client(), url, max_size=MAX_FILE_SIZE, timeout=timeout
+    )
+    if response.status_code == 404:
+        _remember_not_found(url)
+        return None
+    response.raise_for_status()
+
+    _store_blob(sha, response.content, url)
+    return response.text
+
+
+def fetch_file_from_github(
+    package_name: str,
+    version: str,
+    file_path: str,
+    timeout: int = 10,
+    sha: Optional[str] = None
+) -> Optional[str]:
+    """
+    Fetch a file from a package's GitHub repository.
+
+    Args:
+        package_name: Package name
+        version: Package version
+        file_path: Path to file within package
+        timeout: Request timeout in seconds
+        sha: Git blob SHA of the file, if known from the package tree;
+            the content is then served from the shared blob cache
+
+    Returns:
+        File content as string, or None if not found
+
+    Raises:
+        ValueError: If inputs contain invalid characters or path traversal
+    """
+    # SECURITY: Validate all inputs to prevent path traversal attacks
     package_name = validate_package_name(package_name)
+    version = validate_version(version)
+    file_path = validate_file_path(file_path)
+
+    url = PACKAGE_RAW_URL.format(package=package_name, version=version, path=file_path)
+
+    try:
+        # SECURITY: The SHA names a cache file, so it must be plain hex
+        if sha and _BLOB_SHA_RE.fullmatch(sha):
+            return _fetch_blob(url, sha, timeout)
+
+        # SECURITY: Use safe client with SSRF protection and size limits.
+        # Bodies are cached with their ETag and revalidated conditionally
+        # once the server's Cache-Control max-age has passed.
+        return _get_cached(
+            url, timeout=timeout, ttl=None, max_size=MAX_FILE_SIZE, as_text=True
+        )
+
+    except httpx.TimeoutException:
+        eprint(f"Warning: Timeout fetching {file_path} from {package_name}@{version}")
+        return None
+    except Exception as e:
+        eprint(f"Warning: Error fetching {file_path}: {e}")
+        return None
+
+
+def fetch_file_preview(
+    package_name: str,
+    version: str,
+    file_path: str,
+    max_bytes: int = 4096,
+    timeout: int = 10
+) -> Optional[Tuple[str, int]]:
+    """
+    Fetch the beginning of a file without downloading all of it.
+
+    Sends a Range request for the first ``max_bytes`` bytes and reads the
+    full file size from the Content-Range header. Servers that ignore the
+    range return the whole file, which is truncated locally.
+
+    Args:
+        package_name: Package name
+        version: Package version
+        file_path: Path to file within package
+        max_bytes: Number of bytes to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (preview text, full size in bytes), or None if not found
+
+    Raises:
+        ValueError: If inputs contain invalid characters or path traversal
+    """
+    # SECURITY: Validate all inputs to prevent path traversal attacks
+    package_name = validate_package_name(package_name)
+    version = validate_version(version)
+    file_path = validate_file_path(file_path)
+
+    url = PACKAGE_RAW_URL.format(package=package_name, version=version, path=file_path)
+
+    # Ranges apply to the encoded body, so ask for the identity encoding
+    headers = {"Range": f"bytes=0-{max_bytes - 1}", "Accept-Encoding": "identity"}
+
+    try:
+        # SECURITY: Use safe client with SSRF protection and size limits
+        response = fetch_with_size_limit(
+            get_safe_client(), url, max_size=MAX_FILE_SIZE, headers=headers, timeout=timeout
+        )
+
+        if response.status_code == 404:
+            return None
+
+        response.raise_for_status()
+        body = response.content
+        full_size = len(body)
 
-    url = f"https://api.github.com/repos/typst/packages/contents/packages/preview/{package_name}"
+        if response.status_code == 206:
+            # Content-Range: bytes 0-4095/12345
+            total = response.headers.get("content-range", "").rpartition("/")[2]
+            if total.isdigit():
+                full_size = int(total)
 
+        # A cut multi-byte character at the end of the range is dropped
+        return body[:max_bytes].decode("utf-8", errors="ignore"), full_size
+
+    except httpx.TimeoutException:
+        eprint(f"Warning: Timeout fetching {file_path} from {package_name}@{version}")
+        return None
+    except Exception as e:
+        eprint(f"Warning: Error fetching {file_path}: {e}")
+        return None
+
+
+def _submit_candidates(
+    fetch: Any,
+    package_name: str,
+    version: str,
+    candidates: Tuple[str, ...],
+    **kwargs: Any
+) -> List[Future]:
+    """Start ``fetch(package_name, version, name, **kwargs)`` for every candidate name concurrently."""
+    return [
+        _fetch_executor.submit(fetch, package_name, version, name, **kwargs)
+        for name in candidates
+    ]
+
+
+def _present_candidates(
+    tree: Optional[Dict[str, Dict[str, Any]]],
+    candidates: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Keep the candidate names that exist in the package tree (all of them if the tree is unknown)."""
+    if tree is None:
+        return candidates
+    return tuple(name for name in candidates if name in tree)
+
+
+def _submit_tree_files(
+    package_name: str,
+    version: str,
+    tree: Optional[Dict[str, Dict[str, Any]]],
+    candidates: Tuple[str, ...],
+    timeout: int = 10
+) -> List[Future]:
+    """Start fetching the candidate files present in the package tree, by blob SHA when known."""
+    return [
+        _fetch_executor.submit(
+            fetch_file_from_github, package_name, version, name,
+            timeout=timeout, sha=tree[name]["sha"] if tree else None
+        )
+        for name in _present_candidates(tree, candidates)
+    ]
+
+
+def _prefill_blobs_from_archive(
+    package_name: str,
+    version: str,
+    tree: Dict[str, Dict[str, Any]],
+    timeout: int = 30
+) -> None:
+    """
+    Download the package archive into the blob cache if a build needs many files.
+
+    The build's README/LICENSE/CHANGELOG candidates and examples/docs files
+    that are not yet in the blob cache are counted; from
+    PACKAGE_ARCHIVE_MIN_FILES on, one archive download replaces the
+    individual fetches. The build then reads them from the blob cache, and
+    anything the archive lacks is still fetched singly.
+    """
+    wanted = list(_present_candidates(
+        tree, README_CANDIDATES + LICENSE_CANDIDATES + CHANGELOG_CANDIDATES
+    ))
+    for dir_path, extensions in (("examples", EXAMPLE_EXTENSIONS), ("docs", DOCS_EXTENSIONS)):
+        prefix = f"{dir_path}/"
+        wanted.extend(
+            path for path in tree
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+            and path.lower().endswith(extensions)
+        )
+
+    blob_dir = get_blob_cache_dir()
+    missing = {
+        path: sha for path in wanted
+        if _BLOB_SHA_RE.fullmatch(sha := tree[path]["sha"]) and not (blob_dir / sha).exists()
+    }
+    if len(missing) < PACKAGE_ARCHIVE_MIN_FILES:
+        return
+
+    eprint(f"  Downloading package archive ({len(missing)} files)...")
     try:
-        # SECURITY: Use safe client with SSRF protection
-        with create_safe_client(timeout=timeout) as client:
-            response = fetch_with_size_limit(client, url, max_size=MAX_RESPONSE_SIZE)
+        archived = _read_package_archive(package_name, version, set(missing), timeout)
+    except Exception as e:
+        eprint(f"Warning: Could not use package archive for {package_name}@{version}: {e}")
+        return
+
+    for path, data in archived.items():
+        _store_blob(missing[path], data, f"{package_name}@{version}/{path}")
 
-            if response.status_code == 404:
-                raise RuntimeError(f"Package '{package_name}' not found in Typst Universe")
 
-            response.raise_for_status()
-            contents = response.json()
+def _first_result(futures: List[Future]) -> Optional[Any]:
+    """Return the first non-empty result, preferring earlier futures."""
+    for future in futures:
+        result = future.result()
+        if result:
+            return result
+    return None
 
-            # Extract version directories
-            versions = [
-                item["name"] for item in contents
-                if item["type"] == "dir"
-            ]
 
-            return sorted(versions, reverse=True)  # Latest first
+def _read_package_archive(
+    package_name: str,
+    version: str,
+    paths: set[str],
+    timeout: int
+) -> Dict[str, bytes]:
+    """
+    Download a package's published archive and extract the given files.
+
+    Args:
+        package_name: Validated package name
+        version: Validated package version
+        paths: Slash-separated paths within the package
+        timeout: Request timeout in seconds
+
+    Returns:
+        Dictionary of path -> file contents for the paths found in the
+        archive (within the per-file size limit)
+
+    Raises:
+        httpx.HTTPError: If the download fails
+        ValueError: If the archive exceeds the size limit
+        tarfile.TarError: If the archive is malformed
+    """
+    url = PACKAGE_TARBALL_URL.format(package=package_name, version=version)
+
+    # SECURITY: Use safe client with SSRF protection and size limits
+    response = fetch_with_size_limit(
+        get_safe_client(), url, max_size=MAX_RESPONSE_SIZE, timeout=timeout
+    )
+    response.raise_for_status()
+
+    remaining = set(paths)
+    files: Dict[str, bytes] = {}
+    with tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz") as archive:
+        for member in archive:
+            name = member.name.removeprefix("./")
+            if name not in remaining or not member.isfile():
+                continue
+
+            # SECURITY: Apply the same per-file limit as direct fetches
+            if member.size > MAX_FILE_SIZE:
+                eprint(f"Warning: Skipping {name}: {member.size} bytes exceeds limit")
+            else:
+                extracted = archive.extractfile(member)
+                if extracted is not None:
+                    files[name] = extracted.read()
+
+            remaining.discard(name)
+            if not remaining:
+                break
+
+    return files
+
+
+def _is_file_cached(url: str, sha: Optional[str]) -> bool:
+    """Check whether a package file can be served from the blob or HTTP cache."""
+    if sha and _BLOB_SHA_RE.fullmatch(sha):
+        return (get_blob_cache_dir() / sha).exists()
+    with _http_cache_lock:
+        if url in _http_memory_cache:
+            return True
+    return _http_cache_file(url).exists()
+
+
+def fetch_package_files(
+    package_name: str,
+    version: str,
+    file_paths: List[str],
+    timeout: int = 30
+) -> Dict[str, Optional[str]]:
+    """
+    Fetch several files from a package in one go.
+
+    Files already in the blob or HTTP cache are served from there. Paths
+    absent from the package tree are reported as not found without a
+    request. If PACKAGE_ARCHIVE_MIN_FILES or more files still need
+    downloading, the published package archive from packages.typst.org is
+    fetched once and its files are stored in the blob cache. Everything
+    else (including files the archive lacks) is fetched from GitHub in
+    parallel.
+
+    Args:
+        package_name: Package name
+        version: Package version
+        file_paths: Paths to files within package
+        timeout: Request timeout in seconds
+
+    Returns:
+        Dictionary of file path -> content (None if not found), in request order
+
+    Raises:
+        ValueError: If inputs contain invalid characters or path traversal
+    """
+    # SECURITY: Validate all inputs to prevent path traversal attacks
+    package_name = validate_package_name(package_name)
+    version = validate_version(version)
+    file_paths = [validate_file_path(path) for path in file_paths]
+
+    files: Dict[str, Optional[str]] = dict.fromkeys(file_paths)
+    tree = fetch_package_tree(package_name, version)
+
+    # Blob SHA of each requested file that exists, or None if the tree is unknown
+    shas: Dict[str, Optional[str]] = {}
+    for path in file_paths:
+        tree_path = path.replace('\\', '/')
+        if tree is None:
+            shas[path] = None
+        elif tree_path in tree:
+            shas[path] = tree[tree_path]["sha"]
+
+    missing = {
+        path.replace('\\', '/'): path for path, sha in shas.items()
+        if not _is_file_cached(
+            PACKAGE_RAW_URL.format(package=package_name, version=version, path=path), sha
+        )
+    }
+    if len(missing) >= PACKAGE_ARCHIVE_MIN_FILES:
+        eprint(f"  Downloading package archive ({len(missing)} files)...")
+        try:
+            archived = _read_package_archive(package_name, version, set(missing), timeout)
+        except Exception as e:
+            eprint(f"Warning: Could not use package archive for {package_name}@{version}: {e}")
+            archived = {}
+
+        for name, data in archived.items():
+            path = missing[name]
+            sha = shas[path]
+            if sha and _BLOB_SHA_RE.fullmatch(sha):
+                _store_blob(sha, data, f"{package_name}@{version}/{name}")
+            files[path] = data.decode("utf-8", errors="replace")
+
+    pending = [path for path in shas if files[path] is None]
+    contents = _fetch_executor.map(
+        lambda path: fetch_file_from_github(
+            package_name, version, path, timeout=10, sha=shas[path]
+        ),
+        pending,
+    )
+    for path, content in zip(pending, contents):
+        files[path] = content
 
-    except httpx.TimeoutException:
-        raise RuntimeError(f"Timeout while fetching package versions for '{package_name}'")
-    except httpx.HTTPError as e:
-        raise RuntimeError(f"HTTP error while fetching package '{package_name}': {e}")
-    except Exception as e:
-        raise RuntimeError(f"Error fetching package '{package_name}': {e}")
+    return files
 
 
-def fetch_file_from_github(
+def fetch_package_tree(
     package_name: str,
     version: str,
-    file_path: str,
     timeout: int = 10
-) -> Optional[str]:
+) -> Optional[Dict[str, Dict[str, Any]]]:
     """
-    Fetch a file from a package's GitHub repository.
+    Fetch the complete file tree of a package version in one API call.
+
+    Uses the GitHub git trees API (recursive) scoped to the version
+    directory, replacing one contents API call per directory. Published
+    versions never change, so the tree is cached permanently.
 
     Args:
         package_name: Package name
         version: Package version
-        file_path: Path to file within package
         timeout: Request timeout in seconds
 
     Returns:
-        File content as string, or None if not found
+        Dictionary of file path (relative to the version directory) ->
+        {"sha": blob SHA, "size": bytes}, or None if the tree is unavailable
 
     Raises:
         ValueError: If inputs contain invalid characters or path traversal
@@ -457,27 +1706,63 @@ def fetch_file_from_github(
     # SECURITY: Validate all inputs to prevent path traversal attacks
     package_name = validate_package_name(package_name)
     version = validate_version(version)
-    file_path = validate_file_path(file_path)
 
-    url = f"https://raw.githubusercontent.com/typst/packages/main/packages/preview/{package_name}/{version}/{file_path}"
+    url = PACKAGE_TREE_URL.format(package=package_name, version=version)
 
     try:
-        # SECURITY: Use safe client with SSRF protection and size limits
-        with create_safe_client(timeout=timeout) as client:
-            response = fetch_with_size_limit(client, url, max_size=MAX_FILE_SIZE)
+        tree = _get_json_cached(url, timeout=timeout, ttl=PACKAGE_TREE_TTL)
+    except Exception as e:
+        eprint(f"Warning: Error fetching file tree for {package_name}@{version}: {e}")
+        return None
 
-            if response.status_code == 404:
-                return None
+    # A truncated tree would silently hide files; let callers fall back
+    if not tree or tree.get("truncated"):
+        return None
 
-            response.raise_for_status()
-            return response.text
+    return {
+        item["path"]: {"sha": item["sha"], "size": item.get("size", 0)}
+        for item in tree.get("tree", [])
+        if item["type"] == "blob"
+    }
 
-    except httpx.TimeoutException:
-        eprint(f"Warning: Timeout fetching {file_path} from {package_name}@{version}")
-        return None
-    except Exception as e:
-        eprint(f"Warning: Error fetching {file_path}: {e}")
-        return None
+
+def list_package_directory(
+    package_name: str,
+    version: str,
+    dir_path: str
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    List the files directly inside a package directory.
+
+    Served from the cached package tree when available, falling back to
+    the GitHub contents API (one call per directory) otherwise.
+
+    Args:
+        package_name: Package name
+        version: Package version
+        dir_path: Directory path within package
+
+    Returns:
+        List of file entries with name, path, type, size, sha (same shape as
+        fetch_directory_listing), or None if the directory does not exist
+    """
+    tree = fetch_package_tree(package_name, version)
+    if tree is None:
+        return fetch_directory_listing(package_name, version, dir_path)
+
+    prefix = f"{dir_path.strip('/')}/"
+    entries = [
+        {
+            "name": path[len(prefix):],
+            "path": f"packages/preview/{package_name}/{version}/{path}",
+            "type": "file",
+            "size": info["size"],
+            "sha": info["sha"],
+        }
+        for path, info in tree.items()
+        if path.startswith(prefix) and "/" not in path[len(prefix):]
+    ]
+    return entries or None
 
 
 def fetch_directory_listing(
@@ -496,7 +1781,7 @@ def fetch_directory_listing(
         timeout: Request timeout
 
     Returns:
-        List of file/directory entries with name, path, type
+        List of file/directory entries with name, path, type, size, sha
 
     Raises:
         ValueError: If inputs contain invalid characters or path traversal
@@ -506,81 +1791,108 @@ def fetch_directory_listing(
     version = validate_version(version)
     dir_path = validate_file_path(dir_path)
 
-    url = f"https://api.github.com/repos/typst/packages/contents/packages/preview/{package_name}/{version}/{dir_path}"
+    url = PACKAGE_CONTENTS_URL.format(package=package_name, version=version, path=dir_path)
 
     try:
-        # SECURITY: Use safe client with SSRF protection
-        with create_safe_client(timeout=timeout) as client:
-            response = fetch_with_size_limit(client, url, max_size=MAX_RESPONSE_SIZE)
-
-            if response.status_code == 404:
-                return None
-
-            response.raise_for_status()
-            contents = response.json()
-
-            # Return list of entries
-            return [
-                {
-                    "name": item["name"],
-                    "path": item["path"],
-                    "type": item["type"],
-                    "size": item.get("size", 0)
-                }
-                for item in contents
-            ]
+        # SECURITY: Use safe client with SSRF protection. Published versions
+        # never change, so the listing is cached like the package tree.
+        contents = _get_json_cached(url, timeout=timeout, ttl=PACKAGE_TREE_TTL)
+
+        if contents is None:
+            return None
+
+        # Return list of entries
+        return [
+            {
+                "name": item["name"],
+                "path": item["path"],
+                "type": item["type"],
+                "size": item.get("size", 0),
+                "sha": item.get("sha")
+            }
+            for item in contents
+        ]
 
     except Exception as e:
         eprint(f"Warning: Error listing directory {dir_path}: {e}")
         return None
 
 
-def fetch_examples_directory(package_name: str, version: str) -> Optional[List[Dict[str, Any]]]:
-    """
-    Fetch all files from examples/ directory.
+def _is_listed_file(entry: Dict[str, Any], extensions: Tuple[str, ...]) -> bool:
+    """Check whether a directory listing entry is a file with one of the extensions."""
+    return entry["type"] == "file" and entry["name"].lower().endswith(extensions)
 
-    Returns list of example files with their content.
-    """
-    listing = fetch_directory_listing(package_name, version, "examples")
 
-    if not listing:
-        return None
+def _submit_directory_files(
+    package_name: str,
+    version: str,
+    dir_path: str,
+    extensions: Tuple[str, ...]
+) -> List[Tuple[Dict[str, Any], Future]]:
+    """Start fetching the files with the given extensions directly inside a package directory."""
+    listing = list_package_directory(package_name, version, dir_path) or []
+    return [
+        (
+            entry,
+            _fetch_executor.submit(
+                fetch_file_from_github, package_name, version, f"{dir_path}/{entry['name']}",
+                sha=entry.get("sha")
+            ),
+        )
+        for entry in listing
+        if _is_listed_file(entry, extensions)
+    ]
+
 
+def _collect_examples(
+    jobs: List[Tuple[Dict[str, Any], Future]]
+) -> Optional[List[Dict[str, Any]]]:
+    """Wait for example file fetches and build the examples list."""
     examples = []
-    for entry in listing:
-        if entry["type"] == "file" and entry["name"].endswith(".typ"):
-            content = fetch_file_from_github(package_name, version, f"examples/{entry['name']}")
-            if content:
-                examples.append({
-                    "filename": entry["name"],
-                    "content": content,
-                    "size": entry["size"]
-                })
+    for entry, future in jobs:
+        content = future.result()
+        if content:
+            examples.append({
+                "filename": entry["name"],
+                "content": content,
+                "size": entry["size"]
+            })
 
     return examples if examples else None
 
 
-def fetch_docs_directory(package_name: str, version: str) -> Optional[Dict[str, str]]:
+def _collect_docs(jobs: List[Tuple[Dict[str, Any], Future]]) -> Optional[Dict[str, str]]:
+    """Wait for docs file fetches and build the filename -> content mapping."""
+    docs = {}
+    for entry, future in jobs:
+        content = future.result()
+        if content:
+            docs[entry["name"]] = content
+
+    return docs if docs else None
+
+
+def fetch_examples_directory(package_name: str, version: str) -> Optional[List[Dict[str, Any]]]:
     """
-    Fetch all files from docs/ directory.
+    Fetch all files from examples/ directory.
 
-    Returns dictionary of filename -> content.
+    Returns list of example files with their content.
     """
-    listing = fetch_directory_listing(package_name, version, "docs")
+    return _collect_examples(
+        _submit_directory_files(package_name, version, "examples", EXAMPLE_EXTENSIONS)
+    )
 
-    if not listing:
-        return None
 
-    docs = {}
-    for entry in listing:
-        if entry["type"] == "file":
-            # Fetch markdown, text, and typst files
-            if entry["name"].endswith((".md", ".txt", ".typ")):
-                content = fetch_file_from_github(package_name, version, f"docs/{entry['name']}")
-                if content:
-                    docs[entry["name"]] = content
+def fetch_docs_directory(package_name: str, version: str) -> Optional[Dict[str, str]]:
+    """
+    Fetch all files from docs/ directory.
 
-    return docs if docs else None
+    Returns dictionary of filename -> content.
+    """
+    # Fetch markdown, text, and typst files
+    return _collect_docs(
+        _submit_directory_files(package_name, version, "docs", DOCS_EXTENSIONS)
+    )
 
 
 def get_package_metadata(package_name: str, version: str) -> Dict[str, Any]:
@@ -609,7 +1921,7 @@ def get_package_metadata(package_name: str, version: str) -> Dict[str, Any]:
 
     # Proper TOML parsing
     try:
-        parsed = toml.loads(toml_content)
+        parsed = tomllib.loads(toml_content)
 
         # Extract package section
         package_meta = parsed.get("package", {})
@@ -662,58 +1974,89 @@ def build_package_docs(
 
     # Check cache first
     cache_key = f"{package_name}@{version if version else 'latest'}"
-    if cache_key in _package_cache:
+    docs = _cache_get(cache_key)
+    if docs is not None:
         eprint(f"✓ Using cached docs for {cache_key}")
-        return _package_cache[cache_key]
+        return docs
 
     # Get available versions if version not specified
     if not version:
         eprint(f"Fetching versions for {package_name}...")
-        versions = get_package_versions(package_name, timeout=10)
+        version = get_latest_version(package_name, timeout=10)
+        eprint(f"Using latest version: {version}")
 
-        if not versions:
-            raise RuntimeError(f"No versions found for package '{package_name}'")
+    # Resolve through the versioned key so that concurrent "latest" and
+    # explicit-version requests share one build
+    resolved_key = f"{package_name}@{version}"
+    docs = _cache_get(resolved_key)
+    if docs is None:
+        docs = _build_once(
+            resolved_key,
+            lambda: _load_or_fetch_package_docs(package_name, version, start_time, timeout),
+            wait_timeout=timeout,
+        )
 
-        version = versions[0]  # Use latest
-        eprint(f"Using latest version: {version}")
+    _cache_put(cache_key, docs)
+    return docs
+
+
+def _load_or_fetch_package_docs(
+    package_name: str,
+    version: str,
+    start_time: float,
+    timeout: int
+) -> Dict[str, Any]:
+    """
+    Load a package version's docs from the disk cache, or fetch and cache them.
+
+    Args:
+        package_name: Validated package name
+        version: Validated, resolved package version
+        start_time: time.time() when the enclosing request started
+        timeout: Total timeout in seconds, measured from start_time
+
+    Returns:
+        Dictionary containing package documentation
 
+    Raises:
+        RuntimeError: If the timeout is exceeded
+    """
     # Check for cached file
     cache_dir = get_package_cache_dir()
     package_cache_file = cache_dir / f"{package_name}_{version}.json"
 
     if package_cache_file.exists():
-        eprint(f"✓ Loading cached package docs from {package_cache_file}")
-        with open(package_cache_file, "r", encoding="utf-8") as f:
-            docs = json.load(f)
-            _package_cache[cache_key] = docs
+        try:
+            docs = _read_json_file(package_cache_file)
+            eprint(f"✓ Loaded cached package docs from {package_cache_file}")
             return docs
+        except orjson.JSONDecodeError as e:
+            # Drop the corrupt file so this and later calls refetch cleanly
+            eprint(f"Warning: Removing corrupt package docs cache {package_cache_file}: {e}")
+            package_cache_file.unlink(missing_ok=True)
 
     # Fetch package documentation
     eprint(f"Fetching comprehensive documentation for {package_name}@{version}...")
 
-    # Get metadata (includes homepage, repository, etc.)
-    metadata = get_package_metadata(package_name, version)
-
-    # Fetch README
-    readme = None
-    for readme_name in ["README.md", "readme.md", "Readme.md"]:
-        readme = fetch_file_from_github(package_name, version, readme_name, timeout=10)
-        if readme:
-            break
-
-    # Fetch LICENSE
-    license_content = None
-    for license_name in ["LICENSE", "LICENSE.md", "LICENSE.txt"]:
-        license_content = fetch_file_from_github(package_name, version, license_name, timeout=10)
-        if license_content:
-            break
-
-    # Fetch CHANGELOG (if exists)
-    changelog = None
-    for changelog_name in ["CHANGELOG.md", "CHANGELOG", "changelog.md", "HISTORY.md"]:
-        changelog = fetch_file_from_github(package_name, version, changelog_name, timeout=10)
-        if changelog:
-            break
+    # Get metadata (includes homepage, repository, etc.) while fetching the
+    # README/LICENSE/CHANGELOG candidates at once; the first existing name
+    # in each candidate list wins, as with sequential probing
+    metadata_future = _fetch_executor.submit(get_package_metadata, package_name, version)
+
+    # The package tree (reused for the examples/docs listings below) tells
+    # which candidate names exist, so absent ones are not probed for 404s
+    tree = fetch_package_tree(package_name, version)
+    if tree is not None:
+        remaining = max(1, int(timeout - (time.time() - start_time)))
+        _prefill_blobs_from_archive(package_name, version, tree, timeout=remaining)
+    readme_futures = _submit_tree_files(package_name, version, tree, README_CANDIDATES)
+    license_futures = _submit_tree_files(package_name, version, tree, LICENSE_CANDIDATES)
+    changelog_futures = _submit_tree_files(package_name, version, tree, CHANGELOG_CANDIDATES)
+
+    metadata = metadata_future.result()
+    readme = _first_result(readme_futures)
+    license_content = _first_result(license_futures)
+    changelog = _first_result(changelog_futures)  # CHANGELOG is optional
 
     # Check timeout before fetching additional content
     elapsed = time.time() - start_time
@@ -722,15 +2065,18 @@ def build_package_docs(
         examples = None
         docs_dir = None
     else:
-        # Fetch examples/ directory
-        eprint(f"  Fetching examples directory...")
-        examples = fetch_examples_directory(package_name, version)
+        # Fetch the examples/ and docs/ files in one concurrent batch
+        eprint(f"  Fetching examples and docs directories...")
+        example_jobs = _submit_directory_files(
+            package_name, version, "examples", EXAMPLE_EXTENSIONS
+        )
+        docs_jobs = _submit_directory_files(package_name, version, "docs", DOCS_EXTENSIONS)
+
+        examples = _collect_examples(example_jobs)
         if examples:
             eprint(f"  ✓ Found {len(examples)} example files")
 
-        # Fetch docs/ directory
-        eprint(f"  Fetching docs directory...")
-        docs_dir = fetch_docs_directory(package_name, version)
+        docs_dir = _collect_docs(docs_jobs)
         if docs_dir:
             eprint(f"  ✓ Found {len(docs_dir)} documentation files")
 
@@ -749,8 +2095,8 @@ def build_package_docs(
         "changelog": changelog,
         "examples": examples,  # NEW: Example .typ files
         "docs": docs_dir,  # NEW: Additional docs/ directory
-        "universe_url": f"https://typst.app/universe/package/{package_name}/",
-        "github_url": f"https://github.com/typst/packages/tree/main/packages/preview/{package_name}/{version}",
+        "universe_url": UNIVERSE_PACKAGE_URL.format(package=package_name),
+        "github_url": PACKAGE_GITHUB_URL.format(package=package_name, version=version),
         "import_statement": f'#import "@preview/{package_name}:{version}": *',
         "fetched_at": time.time(),
     }
@@ -761,21 +2107,336 @@ def build_package_docs(
     if metadata.get("repository"):
         docs["repository_url"] = metadata["repository"]
 
-    # Cache to file
-    with open(package_cache_file, "w", encoding="utf-8") as f:
-        json.dump(docs, f, indent=2)
-
-    # Cache in memory
-    _package_cache[cache_key] = docs
+    # Cache to file (the caller caches in memory), with the summary alongside
+    try:
+        _write_json_file(package_cache_file, docs)
+    except OSError as e:
+        eprint(f"Warning: Could not write package docs cache {package_cache_file}: {e}")
+    _write_package_summary(docs)
 
     eprint(f"✓ Package documentation built and cached for {package_name}@{version}")
     return docs
 
 
+def prefetch_packages(
+    names: Tuple[str, ...] = POPULAR_PACKAGES,
+    max_workers: int = 4
+) -> list[str]:
+    """
+    Warm the package docs cache for the latest version of several packages.
+
+    Builds run on a dedicated pool (build_package_docs itself waits on the
+    shared fetch pool, so it must not run there). A failing package is
+    logged and skipped without affecting the others.
+
+    Args:
+        names: Package names to prefetch
+        max_workers: Number of packages built concurrently
+
+    Returns:
+        Names of the packages that were prefetched successfully
+    """
+    def prefetch(name: str) -> bool:
+        try:
+            build_package_docs(name)
+            return True
+        except Exception as e:
+            eprint(f"Warning: Could not prefetch package '{name}': {e}")
+            return False
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="typst-mcp-prefetch"
+    ) as executor:
+        results = list(executor.map(prefetch, names))
+
+    return [name for name, ok in zip(names, results) if ok]
+
+
+def _readme_preview(readme: Optional[str]) -> Optional[str]:
+    """Shorten a README to the preview length used in summaries."""
+    if readme and len(readme) > README_PREVIEW_CHARS:
+        return readme[:README_PREVIEW_CHARS] + "..."
+    return readme
+
+
+def summarize_package_docs(docs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a lightweight summary from full package documentation.
+
+    Args:
+        docs: Documentation dictionary from build_package_docs()
+
+    Returns:
+        Summary dictionary (see models.PackageDocsSummary)
+    """
+    return {
+        "package": docs["package"],
+        "version": docs["version"],
+        "metadata": docs["metadata"],
+        "readme_preview": _readme_preview(docs.get("readme")),
+        "readme_full_size": len(docs["readme"].encode("utf-8")) if docs.get("readme") else 0,
+        "license_type": docs["license"][:100] if docs.get("license") else None,
+        "has_changelog": docs.get("changelog") is not None,
+        "examples_list": [
+            {
+                "filename": ex["filename"],
+                "size": ex["size"],
+                "path": f"examples/{ex['filename']}",
+            }
+            for ex in (docs.get("examples") or [])
+        ],
+        "docs_list": [
+            {"filename": name, "size": len(content), "path": f"docs/{name}"}
+            for name, content in (docs.get("docs") or {}).items()
+        ],
+        "import_statement": docs["import_statement"],
+        "universe_url": docs["universe_url"],
+        "github_url": docs["github_url"],
+        "homepage_url": docs.get("homepage_url"),
+        "repository_url": docs.get("repository_url"),
+        "note": "Use summary=false for full content, or get_package_file() for specific files",
+    }
+
+
+def _store_package_summary(summary: Dict[str, Any]) -> None:
+    """Store a summary as a small file next to the docs cache."""
+    summary_file = (
+        get_package_summary_cache_dir() / f"{summary['package']}_{summary['version']}.json"
+    )
+    try:
+        _write_json_file(summary_file, summary)
+    except OSError as e:
+        eprint(f"Warning: Could not write package summary {summary_file}: {e}")
+
+
+def _write_package_summary(docs: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize full docs and store the summary next to the docs cache file."""
+    summary = summarize_package_docs(docs)
+    _store_package_summary(summary)
+    return summary
+
+
+def get_cached_package_summary(package_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a package summary from cache only (no network fetch).
+
+    Summaries are stored as small files next to the full docs, so browsing
+    a package does not have to load and parse its full documentation.
+    Summaries built from previews (build_package_summary) are stored there
+    too. Cached docs without a summary file (older caches) are summarized
+    once and the summary is stored.
+
+    Args:
+        package_name: Package name
+        version: Package version
+
+    Returns:
+        Summary dictionary (see models.PackageDocsSummary), or None if
+        neither the docs nor a summary of the package version are cached
+
+    Raises:
+        ValueError: If inputs contain invalid characters or path traversal
+    """
+    # SECURITY: Validate inputs before building cache file paths
+    package_name = validate_package_name(package_name)
+    version = validate_version(version)
+
+    docs = _cache_get(f"{package_name}@{version}")
+    if docs is not None:
+        return summarize_package_docs(docs)
+
+    summary_file = get_package_summary_cache_dir() / f"{package_name}_{version}.json"
+    if summary_file.exists():
+        try:
+            return _read_json_file(summary_file)
+        except orjson.JSONDecodeError as e:
+            eprint(f"Warning: Removing corrupt package summary {summary_file}: {e}")
+            summary_file.unlink(missing_ok=True)
+        except OSError as e:
+            eprint(f"Warning: Could not read package summary {summary_file}: {e}")
+
+    docs = get_cached_package_docs(package_name, version)
+    if docs:
+        return _write_package_summary(docs)
+
+    return None
+
+
+def build_package_summary(
+    package_name: str,
+    version: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build a lightweight documentation summary for a package.
+
+    Uses a cached summary or cached full documentation when available.
+    Otherwise only the metadata, short previews of the README and LICENSE
+    (via Range requests) and the examples/ and docs/ listings are fetched,
+    so large files are never downloaded in full. The result is stored in
+    the summary cache, so later calls make no requests.
+
+    Args:
+        package_name: Name of the package
+        version: Specific version (defaults to latest)
+
+    Returns:
+        Summary dictionary (see models.PackageDocsSummary)
+
+    Raises:
+        RuntimeError: If package cannot be fetched
+        ValueError: If inputs contain invalid characters or path traversal
+    """
+    # SECURITY: Validate package name first
+    package_name = validate_package_name(package_name)
+    if version:
+        version = validate_version(version)
+    else:
+        version = get_latest_version(package_name, timeout=10)
+
+    summary = get_cached_package_summary(package_name, version)
+    if summary:
+        return summary
+
+    eprint(f"Fetching documentation summary for {package_name}@{version}...")
+
+    # Issue the requests up front; they are independent of each other.
+    # A 2KB prefix always holds more than README_PREVIEW_CHARS characters
+    # when the file is longer than the preview.
+    metadata_future = _fetch_executor.submit(get_package_metadata, package_name, version)
+
+    # Only candidate names present in the package tree are previewed; the
+    # tree is cached, so the directory listings below reuse it
+    tree = fetch_package_tree(package_name, version)
+    readme_futures = _submit_candidates(
+        fetch_file_preview, package_name, version,
+        _present_candidates(tree, README_CANDIDATES), max_bytes=2048
+    )
+    license_futures = _submit_candidates(
+        fetch_file_preview, package_name, version,
+        _present_candidates(tree, LICENSE_CANDIDATES), max_bytes=512
+    )
+    changelog_futures = _submit_candidates(
+        fetch_file_preview, package_name, version,
+        _present_candidates(tree, CHANGELOG_CANDIDATES), max_bytes=1
+    )
+    examples_future = _fetch_executor.submit(
+        list_package_directory, package_name, version, "examples"
+    )
+    docs_future = _fetch_executor.submit(list_package_directory, package_name, version, "docs")
+
+    metadata = metadata_future.result()
+    readme, readme_size = _first_result(readme_futures) or (None, 0)
+    license_preview = _first_result(license_futures)
+    license_type = license_preview[0][:100] if license_preview else None
+    has_changelog = _first_result(changelog_futures) is not None
+
+    examples_list = [
+        {"filename": entry["name"], "size": entry["size"], "path": f"examples/{entry['name']}"}
+        for entry in (examples_future.result() or [])
+        if _is_listed_file(entry, EXAMPLE_EXTENSIONS)
+    ]
+    docs_list = [
+        {"filename": entry["name"], "size": entry["size"], "path": f"docs/{entry['name']}"}
+        for entry in (docs_future.result() or [])
+        if _is_listed_file(entry, DOCS_EXTENSIONS)
+    ]
+
+    summary = {
+        "package": package_name,
+        "version": version,
+        "metadata": metadata,
+        "readme_preview": _readme_preview(readme),
+        "readme_full_size": readme_size,
+        "license_type": license_type,
+        "has_changelog": has_changelog,
+        "examples_list": examples_list,
+        "docs_list": docs_list,
+        "import_statement": f'#import "@preview/{package_name}:{version}": *',
+        "universe_url": UNIVERSE_PACKAGE_URL.format(package=package_name),
+        "github_url": PACKAGE_GITHUB_URL.format(package=package_name, version=version),
+        "homepage_url": metadata.get("homepage"),
+        "repository_url": metadata.get("repository"),
+        "note": "Use summary=false for full content, or get_package_file() for specific files",
+    }
+
+    # Published versions never change, so the summary can be reused as-is
+    _store_package_summary(summary)
+    return summary
+
+
+# Search index as one (names, lowered, trigrams) tuple, rebuilt lazily whenever
+# the package listing changes. A rebuild creates a new tuple and publishes it
+# with a single assignment; published indexes are never mutated, so a reader
+# that grabs the reference once always sees one consistent snapshot.
+_SearchIndex = Tuple[Tuple[str, ...], Tuple[str, ...], Mapping[str, frozenset]]
+_search_index: _SearchIndex = ((), (), MappingProxyType({}))
+
+
+def _fetch_universe_listing(timeout: int = 15) -> list[str]:
+    """
+    Fetch the names of all packages in the Typst Universe preview namespace.
+
+    The listing is cached and revalidated with ETags (see _get_json_cached).
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        List of package names, in repository order
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response exceeds the size limit
+        RuntimeError: If the listing does not exist
+    """
+    url = PACKAGES_CONTENTS_URL
+
+    # Conditional GETs make the warm path a 304 without a body; GitHub does
+    # not count those against the rate limit
+    contents = _get_json_cached(url, timeout=timeout, ttl=UNIVERSE_LISTING_TTL)
+    if contents is None:
+        raise RuntimeError("Typst Universe package listing not found")
+
+    return [
+        item["name"] for item in contents
+        if item["type"] == "dir"
+    ]
+
+
+def _get_search_index(names: list[str]) -> _SearchIndex:
+    """
+    Return the trigram index for a package listing, rebuilding it if needed.
+
+    The index maps every 3-character shingle of each lowercased package
+    name to the set of positions of the names containing it.
+    """
+    global _search_index
+
+    index = _search_index
+    names = tuple(names)
+    if names == index[0]:
+        return index
+
+    lowered = tuple(name.lower() for name in names)
+    postings: Dict[str, set[int]] = {}
+    for i, name in enumerate(lowered):
+        for j in range(len(name) - 2):
+            postings.setdefault(name[j:j + 3], set()).add(i)
+    trigrams = MappingProxyType({t: frozenset(ids) for t, ids in postings.items()})
+
+    index = (names, lowered, trigrams)
+    _search_index = index
+    return index
+
+
 def search_packages(query: str, max_results: int = 20) -> list[Dict[str, str]]:
     """
     Search for packages in Typst Universe.
 
+    Queries of three or more characters are answered from a trigram index
+    over the package names; shorter queries fall back to a linear scan.
+    Results keep the order of the package listing.
+
     Args:
         query: Search query
         max_results: Maximum number of results to return
@@ -785,38 +2446,39 @@ def search_packages(query: str, max_results: int = 20) -> list[Dict[str, str]]:
     """
     # For now, we'll list all packages and filter
     # In the future, this could use a dedicated search API
-    url = "https://api.github.com/repos/typst/packages/contents/packages/preview"
-
     try:
-        # SECURITY: Use safe client with SSRF protection
-        with create_safe_client(timeout=15) as client:
-            response = fetch_with_size_limit(client, url, max_size=MAX_RESPONSE_SIZE)
-            response.raise_for_status()
-            contents = response.json()
-
-            # Filter packages by query
-            packages = []
-            query_lower = query.lower()
-
-            for item in contents:
-                if item["type"] == "dir":
-                    package_name = item["name"]
-                    if query_lower in package_name.lower():
-                        packages.append({
-                            "name": package_name,
-                            "url": f"https://typst.app/universe/package/{package_name}/",
-                            "import": f'@preview/{package_name}',
-                        })
-
-                        if len(packages) >= max_results:
-                            break
-
-            return packages
-
+        index = _get_search_index(_fetch_universe_listing())
     except Exception as e:
         eprint(f"Error searching packages: {e}")
         return []
 
+    names, lowered, trigrams = index
+    query_lower = query.lower()
+
+    if len(query_lower) >= 3:
+        shingles = {query_lower[i:i + 3] for i in range(len(query_lower) - 2)}
+        # Intersect the smallest posting sets first
+        postings = sorted((trigrams.get(t, frozenset()) for t in shingles), key=len)
+        candidates = frozenset.intersection(*postings) if postings[0] else frozenset()
+        # Trigram hits are only candidates; confirm the actual substring
+        matches = (i for i in sorted(candidates) if query_lower in lowered[i])
+    else:
+        matches = (i for i, name in enumerate(lowered) if query_lower in name)
+
+    packages = []
+    for i in matches:
+        package_name = names[i]
+        packages.append({
+            "name": package_name,
+            "url": UNIVERSE_PACKAGE_URL.format(package=package_name),
+            "import": f'@preview/{package_name}',
+        })
+
+        if len(packages) >= max_results:
+            break
+
+    return packages
+
 
 def list_all_packages() -> list[str]:
     """
@@ -825,49 +2487,54 @@ def list_all_packages() -> list[str]:
     Returns:
         List of package names
     """
-    url = "https://api.github.com/repos/typst/packages/contents/packages/preview"
-
     try:
-        # SECURITY: Use safe client with SSRF protection
-        with create_safe_client(timeout=15) as client:
-            response = fetch_with_size_limit(client, url, max_size=MAX_RESPONSE_SIZE)
-            response.raise_for_status()
-            contents = response.json()
-
-            return [
-                item["name"] for item in contents
-                if item["type"] == "dir"
-            ]
+        return _fetch_universe_listing()
 
     except Exception as e:
         eprint(f"Error listing packages: {e}")
         return []
 
 
-def list_cached_packages() -> list[Dict[str, str]]:
+def list_cached_packages() -> list[Dict[str, Any]]:
     """
     List all locally cached packages.
 
+    Uses a single os.scandir() pass, so each entry's size and modification
+    time come from the directory scan instead of separate stat calls.
+
     Returns:
         List of dictionaries with package info:
-        [{"package": "name", "version": "x.y.z", "cache_file": "path"}]
+        [{"package": "name", "version": "x.y.z", "cache_file": "path",
+          "uri": "...", "mtime": 1700000000.0, "size": 12345}]
     """
     cache_dir = get_package_cache_dir()
     cached = []
 
-    for cache_file in cache_dir.glob("*.json"):
-        # Parse filename: packagename_version.json
-        stem = cache_file.stem
-        if "_" in stem:
-            parts = stem.rsplit("_", 1)
-            if len(parts) == 2:
-                package, version = parts
-                cached.append({
-                    "package": package,
-                    "version": version,
-                    "cache_file": str(cache_file),
-                    "uri": f"typst://v1/packages/{package}/{version}",
-                })
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            # Parse filename: packagename_version.json. Package names cannot
+            # contain "_", so the first one separates name and version.
+            if not entry.name.endswith(".json"):
+                continue
+            package, sep, version = entry.name[:-len(".json")].partition("_")
+            if not sep or not package or not version:
+                continue
+            try:
+                # Symlinks are skipped; cache files are always regular files
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                # Removed while scanning
+                continue
+            cached.append({
+                "package": package,
+                "version": version,
+                "cache_file": entry.path,
+                "uri": f"typst://v1/packages/{package}/{version}",
+                "mtime": st.st_mtime,
+                "size": st.st_size,
+            })
 
     return cached
 
@@ -885,8 +2552,9 @@ def get_cached_package_docs(package_name: str, version: str) -> Optional[Dict[st
     """
     # Check memory cache first
     cache_key = f"{package_name}@{version}"
-    if cache_key in _package_cache:
-        return _package_cache[cache_key]
+    docs = _cache_get(cache_key)
+    if docs is not None:
+        return docs
 
     # Check file cache
     cache_dir = get_package_cache_dir()
@@ -894,12 +2562,46 @@ def get_cached_package_docs(package_name: str, version: str) -> Optional[Dict[st
 
     if cache_file.exists():
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                docs = json.load(f)
-                _package_cache[cache_key] = docs
-                return docs
+            docs = _read_json_file(cache_file)
+            _cache_put(cache_key, docs)
+            return docs
+        except orjson.JSONDecodeError as e:
+            # Drop the corrupt file so the next full fetch rebuilds it
+            eprint(f"Warning: Removing corrupt cached docs {cache_file}: {e}")
+            cache_file.unlink(missing_ok=True)
+            return None
         except Exception as e:
             eprint(f"Error reading cached docs: {e}")
             return None
 
     return None
+
+
+def invalidate_package_docs(package_name: str, version: Optional[str] = None) -> None:
+    """
+    Drop cached documentation for a package so the next access refetches it.
+
+    Args:
+        package_name: Package name
+        version: Package version (all cached versions if not given)
+
+    Raises:
+        ValueError: If inputs contain invalid characters or path traversal
+    """
+    # SECURITY: Validate inputs before building cache file paths
+    package_name = validate_package_name(package_name)
+    if version:
+        version = validate_version(version)
+
+    with _package_cache_lock:
+        for cache_key in list(_package_cache):
+            cached_name, _, cached_version = cache_key.partition("@")
+            if cached_name == package_name and (
+                version is None or cached_version in (version, "latest")
+            ):
+                del _package_cache[cache_key]
+
+    pattern = f"{package_name}_{version}.json" if version else f"{package_name}_*.json"
+    for cache_dir in (get_package_cache_dir(), get_package_summary_cache_dir()):
+        for cache_file in cache_dir.glob(pattern):
+            cache_file.unlink(missing_ok=True)
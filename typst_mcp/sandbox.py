@@ -7,9 +7,18 @@ Environment variable TYPST_MCP_DISABLE_SANDBOX=1 to opt-out.
 
 import os
 import sys
+import platform
+import shlex
 import shutil
+import stat
+import struct
 import subprocess
 import json
+import tempfile
+import getpass
+import ctypes
+import ctypes.util
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Union
 
@@ -19,6 +28,143 @@ def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
+# Operating system, resolved once at import (platform.system() runs uname)
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+
+if _IS_WINDOWS:
+    fcntl = None
+else:
+    import fcntl
+
+
+# Home directory, resolved once at import (expanduser looks up $HOME or the
+# password database on every call)
+_HOME = os.path.expanduser("~")
+
+
+def _expand(path: str) -> str:
+    """Expand a leading "~" to the home directory, like os.path.expanduser."""
+    if path == "~" or path.startswith(("~/", "~" + os.sep)):
+        return _HOME + path[1:]
+    if path.startswith("~"):
+        # "~user" forms need a password database lookup
+        return os.path.expanduser(path)
+    return path
+
+
+def _split_paths(value: Optional[str]) -> List[str]:
+    """Split a comma-separated path list, stripping whitespace and dropping empty entries."""
+    if not value:
+        return []
+    return [p for p in map(str.strip, value.split(",")) if p]
+
+
+def _is_glob(path: str) -> bool:
+    """Check whether a sandbox path entry is a glob pattern."""
+    return any(c in path for c in "*?[")
+
+
+def _dedupe_paths(paths: List[str]) -> List[str]:
+    """
+    Drop duplicate paths and paths inside another listed directory.
+
+    Absolute entries are normalized first; a rule for a directory also
+    covers everything below it, so nested entries are redundant. Glob
+    patterns and relative entries (e.g. "*.pem", ".env") are kept as-is.
+    Order is preserved.
+    """
+    normalized = []
+    seen = set()
+    for path in paths:
+        if os.path.isabs(path) and not _is_glob(path):
+            path = os.path.normpath(path)
+        if path not in seen:
+            seen.add(path)
+            normalized.append(path)
+
+    roots = {p for p in normalized if os.path.isabs(p) and not _is_glob(p)}
+
+    def is_nested(path: str) -> bool:
+        parent = os.path.dirname(path)
+        while parent != path:
+            if parent in roots:
+                return True
+            path, parent = parent, os.path.dirname(parent)
+        return False
+
+    return [p for p in normalized if p not in roots or not is_nested(p)]
+
+
+# Permission bits that let other users modify a directory's entries
+_GROUP_OTHER_WRITE = stat.S_IWGRP | stat.S_IWOTH
+
+# Linux inode flag ioctls (linux/fs.h), as used by chattr
+_FS_IOC_GETFLAGS = 0x80086601
+_FS_IOC_SETFLAGS = 0x40086602
+_FS_IMMUTABLE_FL = 0x00000010
+
+
+def _set_immutable(path: str, immutable: bool) -> None:
+    """
+    Set or clear a file's immutable flag without spawning chflags/chattr.
+
+    macOS/BSD: the user immutable flag (uchg) via chflags(2).
+    Linux: the immutable inode flag (+i) via the FS_IOC_SETFLAGS ioctl,
+    which requires CAP_LINUX_IMMUTABLE.
+
+    Raises:
+        OSError: If the flag cannot be changed
+    """
+    if _IS_LINUX:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            flags, = struct.unpack("i", fcntl.ioctl(fd, _FS_IOC_GETFLAGS, struct.pack("i", 0)))
+            flags = flags | _FS_IMMUTABLE_FL if immutable else flags & ~_FS_IMMUTABLE_FL
+            fcntl.ioctl(fd, _FS_IOC_SETFLAGS, struct.pack("i", flags))
+        finally:
+            os.close(fd)
+    else:
+        flags = os.stat(path).st_flags
+        os.chflags(path, flags | stat.UF_IMMUTABLE if immutable else flags & ~stat.UF_IMMUTABLE)
+
+
+@lru_cache(maxsize=None)
+def _which_srt() -> Optional[str]:
+    """Locate a globally installed srt (the PATH is searched once per process)."""
+    return shutil.which("srt")
+
+
+@lru_cache(maxsize=None)
+def _which_npx() -> Optional[str]:
+    """Locate npx (the PATH is searched once per process)."""
+    return shutil.which("npx")
+
+
+@lru_cache(maxsize=None)
+def _npx_srt_available() -> bool:
+    """
+    Check whether npx can run the pinned sandbox runtime.
+
+    The probe (which may download the package on first use) runs once per
+    process; later sandbox initializations reuse its result.
+    """
+    try:
+        # SECURITY: Use pinned version to prevent supply chain attacks
+        pinned_package = f"{SANDBOX_RUNTIME_PACKAGE}@{SANDBOX_RUNTIME_VERSION}"
+        result = subprocess.run(
+            ["npx", "-y", pinned_package, "--version"],
+            capture_output=True,
+            timeout=30,  # First download may take time
+            text=True
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
 class SandboxConfig:
     """Configuration for sandbox filesystem and network restrictions."""
 
@@ -68,28 +214,30 @@ class SandboxConfig:
         "*_ecdsa",
     ]
 
+    # Expanded once when the class is defined, shared by all instances
+    ALWAYS_DENY_READ_EXPANDED = tuple(_expand(p) for p in ALWAYS_DENY_READ)
+
     def __init__(self, temp_dir: str, current_dir: str = ".", read_allow_only: list = None):
         self.temp_dir = temp_dir
         self.current_dir = current_dir
 
         # SECURITY: Always block sensitive paths (even in whitelist mode)
-        self.always_deny_read = [os.path.expanduser(p) for p in self.ALWAYS_DENY_READ]
+        self.always_deny_read = self.ALWAYS_DENY_READ_EXPANDED
 
         # Read mode: blacklist (default) or whitelist
         self.read_whitelist_mode = read_allow_only is not None
         if self.read_whitelist_mode:
             # Whitelist mode: Only allow specific paths
-            self.allow_read = [os.path.expanduser(p) for p in read_allow_only]
-            self.deny_read = self.always_deny_read  # Still block sensitive files
+            self.allow_read = [_expand(p) for p in read_allow_only]
+            self.deny_read = list(self.always_deny_read)  # Still block sensitive files
             eprint(f"🔒 Read whitelist mode: Only allowing {len(self.allow_read)} paths")
             eprint(f"   (Still blocking {len(self.always_deny_read)} sensitive paths)")
         else:
             # Blacklist mode (default): Allow most, block sensitive
-            self.deny_read = self.always_deny_read.copy()
+            self.deny_read = list(self.always_deny_read)
             self.allow_read = None
 
         # Filesystem: Allow-list for writes (deny most, allow specific)
-        import tempfile
         system_temp_dir = tempfile.gettempdir()  # Cross-platform temp directory
 
         # SECURITY: Use system temp directory for cross-platform compatibility
@@ -127,6 +275,10 @@ class SandboxConfig:
         # Load custom rules from environment variables
         self._load_custom_rules()
 
+        # temp_dir is listed explicitly above, but srt only needs the
+        # outermost directories
+        self.allow_write = _dedupe_paths(self.allow_write)
+
     def _load_custom_rules(self):
         """Load and apply custom sandbox rules from environment variables.
 
@@ -134,11 +286,12 @@ class SandboxConfig:
         TYPST_MCP_ALLOW_WRITE and TYPST_MCP_ALLOW_DOMAINS have been removed because
         environment variables can be set by malicious software to expand permissions.
         """
+        env = os.environ
+
         # Additional deny-read paths (only in blacklist mode)
         if not self.read_whitelist_mode:
-            if custom_deny := os.getenv("TYPST_MCP_DENY_READ"):
-                paths = [p.strip() for p in custom_deny.split(",") if p.strip()]
-                expanded = [os.path.expanduser(p) for p in paths]
+            if custom_deny := _split_paths(env.get("TYPST_MCP_DENY_READ")):
+                expanded = [_expand(p) for p in custom_deny]
                 self.deny_read.extend(expanded)
                 eprint(f"Custom deny-read paths: {expanded}")
 
@@ -149,7 +302,7 @@ class SandboxConfig:
 
         # SECURITY: TYPST_MCP_ALLOW_WRITE removed - env vars can expand attack surface
         # If you need custom write paths, use command-line flags or a config file
-        if os.getenv("TYPST_MCP_ALLOW_WRITE"):
+        if env.get("TYPST_MCP_ALLOW_WRITE"):
             eprint("="*60)
             eprint("WARNING: TYPST_MCP_ALLOW_WRITE is no longer supported")
             eprint("="*60)
@@ -162,7 +315,7 @@ class SandboxConfig:
             eprint("="*60)
 
         # SECURITY: TYPST_MCP_ALLOW_DOMAINS removed - env vars can expand attack surface
-        if os.getenv("TYPST_MCP_ALLOW_DOMAINS"):
+        if env.get("TYPST_MCP_ALLOW_DOMAINS"):
             eprint("="*60)
             eprint("WARNING: TYPST_MCP_ALLOW_DOMAINS is no longer supported")
             eprint("="*60)
@@ -188,7 +341,7 @@ class SandboxConfig:
 
         if sys.platform == "darwin":
             # macOS: ~/Library/Caches/typst/packages/
-            macos_cache = os.path.expanduser("~/Library/Caches/typst")
+            macos_cache = _expand("~/Library/Caches/typst")
             cache_dirs.append(macos_cache)
         elif sys.platform == "win32":
             # Windows: %LOCALAPPDATA%/typst/packages/
@@ -198,7 +351,7 @@ class SandboxConfig:
                 cache_dirs.append(win_cache)
         else:
             # Linux and other Unix: ~/.cache/typst/packages/
-            xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+            xdg_cache = os.environ.get("XDG_CACHE_HOME", _expand("~/.cache"))
             linux_cache = os.path.join(xdg_cache, "typst")
             cache_dirs.append(linux_cache)
 
@@ -221,12 +374,14 @@ class SandboxConfig:
         # Read restrictions
         if self.read_whitelist_mode:
             # Whitelist mode: Only allow specific paths
-            settings["filesystem"]["allowRead"] = self.allow_read
-            # SECURITY: Always deny sensitive paths even in whitelist mode
-            settings["filesystem"]["denyRead"] = self.always_deny_read
-        else:
-            # Blacklist mode: Deny specific paths
-            settings["filesystem"]["denyRead"] = self.deny_read
+            settings["filesystem"]["allowRead"] = _dedupe_paths(self.allow_read)
+        # Blacklist mode: Deny specific paths
+        # SECURITY: Always deny sensitive paths even in whitelist mode
+        # (deny_read holds exactly always_deny_read in that mode)
+        # Literal paths first, then glob patterns, each in configured order
+        exact = [p for p in self.deny_read if not _is_glob(p)]
+        patterns = [p for p in self.deny_read if _is_glob(p)]
+        settings["filesystem"]["denyRead"] = _dedupe_paths(exact + patterns)
 
         # Write restrictions (always whitelist)
         settings["filesystem"]["allowWrite"] = self.allow_write
@@ -249,6 +404,8 @@ class TypestSandbox:
         self.settings_file = None  # Path to temporary settings file
         self.settings_immutable = False  # Whether immutability flag is set
         self._lock_fd = None  # Linux: file descriptor for advisory lock
+        self._cmd_prefix = None  # Sandbox command prefix (set with the settings file)
+        self._cmd_prefix_str = None  # The same prefix, shell-quoted
 
         # SECURITY: Sandbox disable is command-line flag only (not ENV variable)
         # Rationale: Malicious software could set TYPST_MCP_DISABLE_SANDBOX=1
@@ -272,7 +429,7 @@ class TypestSandbox:
             return False
 
         # Try 1: Check if srt is globally installed
-        if shutil.which("srt"):
+        if _which_srt():
             self.sandboxed = True
             self.sandbox_method = "srt-installed"
             self._create_settings_file()
@@ -280,25 +437,13 @@ class TypestSandbox:
             return True
 
         # Try 2: Check if we can use npx (Node.js installed)
-        if shutil.which("npx"):
-            # Test if npx can run srt (will auto-download on first use)
-            try:
-                # SECURITY: Use pinned version to prevent supply chain attacks
-                pinned_package = f"{SANDBOX_RUNTIME_PACKAGE}@{SANDBOX_RUNTIME_VERSION}"
-                result = subprocess.run(
-                    ["npx", "-y", pinned_package, "--version"],
-                    capture_output=True,
-                    timeout=30,  # First download may take time
-                    text=True
-                )
-                if result.returncode == 0:
-                    self.sandboxed = True
-                    self.sandbox_method = "srt-npx"
-                    self._create_settings_file()
-                    eprint("✅ Sandboxing enabled (auto-downloaded via npx)")
-                    return True
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                pass
+        # Test if npx can run srt (will auto-download on first use)
+        if _which_npx() and _npx_srt_available():
+            self.sandboxed = True
+            self.sandbox_method = "srt-npx"
+            self._create_settings_file()
+            eprint("✅ Sandboxing enabled (auto-downloaded via npx)")
+            return True
 
         # Fallback: No sandboxing available
         self._print_fallback_message()
@@ -316,21 +461,16 @@ class TypestSandbox:
 
         Cross-platform: Works on Unix (Linux/macOS/BSD) and Windows
         """
-        import tempfile
-        import stat
-        import platform
-
-        is_windows = platform.system() == "Windows"
-
         # SECURITY: Verify parent directory has restricted permissions (Unix only)
-        if not is_windows:
-            parent_dir = Path(self.temp_dir)
-            if parent_dir.exists():
-                parent_stat = parent_dir.stat()
-                # Check if directory is writable by others (potential security risk)
-                if parent_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
-                    eprint(f"⚠️  WARNING: Temp directory {parent_dir} is writable by group/others")
-                    eprint("   This may allow settings file tampering")
+        if not _IS_WINDOWS:
+            try:
+                parent_mode = os.stat(self.temp_dir).st_mode
+            except FileNotFoundError:
+                parent_mode = 0
+            # Check if directory is writable by others (potential security risk)
+            if parent_mode & _GROUP_OTHER_WRITE:
+                eprint(f"⚠️  WARNING: Temp directory {self.temp_dir} is writable by group/others")
+                eprint("   This may allow settings file tampering")
 
         # SECURITY: Create settings file with O_EXCL (atomic, prevents race conditions)
         # tempfile.mkstemp() uses O_EXCL by default
@@ -344,7 +484,7 @@ class TypestSandbox:
         try:
             # SECURITY: Set restrictive permissions atomically using file descriptor
             # Initially set to 0o600 for writing, will change to 0o400 (read-only) after
-            if not is_windows:
+            if not _IS_WINDOWS:
                 # Unix: Use fchmod on file descriptor (atomic, prevents symlink attacks)
                 # Mode 0o600 = owner read/write only (no group/other access)
                 os.fchmod(fd, 0o600)
@@ -359,7 +499,7 @@ class TypestSandbox:
                 settings["filesystem"]["denyWrite"] = []
             settings["filesystem"]["denyWrite"].append(path)  # Protect settings file from modification
 
-            settings_json = json.dumps(settings, indent=2).encode('utf-8')
+            settings_json = json.dumps(settings, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
             os.write(fd, settings_json)
 
             # Verify file was written correctly (sanity check)
@@ -369,17 +509,14 @@ class TypestSandbox:
             # SECURITY: Make file read-only after writing (prevents modification)
             # Mode 0o400 = owner read-only (srt needs to read it, but nobody should modify)
             # This prevents tampering even by the user running the process
-            if not is_windows:
+            if not _IS_WINDOWS:
                 os.fchmod(fd, 0o400)  # Atomic: change permissions before closing
 
                 # SECURITY: Set immutability flag on file descriptor (before closing)
                 # This is more secure than setting after close (eliminates timing window)
-                if platform.system() == "Darwin":
+                if _IS_DARWIN:
                     # macOS: Use fchflags on file descriptor (atomic)
                     try:
-                        import ctypes
-                        import ctypes.util
-
                         # Load libc
                         libc = ctypes.CDLL(ctypes.util.find_library('c'))
 
@@ -396,12 +533,10 @@ class TypestSandbox:
                     except Exception:
                         eprint("   Immutability: fchflags() not available, will set after close")
 
-                elif platform.system() == "Linux":
+                elif _IS_LINUX:
                     # Linux: Try advisory file locking (best effort without root)
                     # This provides some protection even without chattr +i
                     try:
-                        import fcntl
-
                         # Duplicate fd before we close it (lock will remain on dup)
                         # This allows us to keep the lock alive while closing original fd
                         lock_fd = os.dup(fd)
@@ -434,42 +569,32 @@ class TypestSandbox:
         # SECURITY: Set OS-level immutability to prevent deletion/renaming (if not already set)
         # This prevents TOCTOU attack where malicious code deletes settings and creates new one
         # Note: On macOS, this may already be set via fchflags() before closing
-        if not is_windows and not self.settings_immutable:
-            try:
-                # macOS/BSD: Use chflags to set user immutable flag (fallback if fchflags failed)
-                # Linux: Try chattr (requires root, so will likely fail)
-                if platform.system() == "Darwin":
+        if not _IS_WINDOWS and not self.settings_immutable:
+            # macOS/BSD: Use chflags(2) to set user immutable flag (fallback if fchflags failed)
+            # Linux: Set +i via ioctl (requires root, so will likely fail)
+            if _IS_DARWIN:
+                try:
                     # macOS: uchg = user immutable (can be unset by owner for cleanup)
-                    subprocess.run(
-                        ["chflags", "uchg", path],
-                        check=True,
-                        capture_output=True,
-                        timeout=5
-                    )
+                    _set_immutable(path, True)
                     self.settings_immutable = True
                     eprint("   Immutability: macOS uchg flag set via chflags (fallback)")
-                elif platform.system() == "Linux":
-                    # Linux: +i flag (requires root, so this will likely fail)
-                    # We still try in case process has CAP_LINUX_IMMUTABLE capability
-                    result = subprocess.run(
-                        ["chattr", "+i", path],
-                        capture_output=True,
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        self.settings_immutable = True
-                        eprint("   Immutability: Linux +i flag set (prevents deletion/rename)")
-                    else:
-                        eprint("   Immutability: Linux +i failed (requires root), relying on denyWrite + advisory lock")
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                # Not critical - we still have denyWrite protection in sandbox config
-                eprint("   Immutability: Could not set OS flag, relying on denyWrite protection")
+                except OSError:
+                    # Not critical - we still have denyWrite protection in sandbox config
+                    eprint("   Immutability: Could not set OS flag, relying on denyWrite protection")
+            elif _IS_LINUX:
+                # Linux: +i flag (requires root, so this will likely fail)
+                # We still try in case process has CAP_LINUX_IMMUTABLE capability
+                try:
+                    _set_immutable(path, True)
+                    self.settings_immutable = True
+                    eprint("   Immutability: Linux +i flag set (prevents deletion/rename)")
+                except OSError:
+                    eprint("   Immutability: Linux +i failed (requires root), relying on denyWrite + advisory lock")
 
         # SECURITY: Platform-specific permission verification and hardening
-        if is_windows:
+        if _IS_WINDOWS:
             # Windows: Use ctypes to set file attributes and deny DELETE permission
             try:
-                import getpass
                 username = getpass.getuser()
 
                 # Step 1: Set read-only attribute (prevents modification)
@@ -520,6 +645,17 @@ class TypestSandbox:
 
         self.settings_file = path
 
+        # Build the sandboxed command prefix once for wrap_command()
+        if self.sandbox_method == "srt-installed":
+            # Use globally installed srt
+            self._cmd_prefix = ["srt", "--settings", path, "--"]
+        elif self.sandbox_method == "srt-npx":
+            # Use npx to run srt with pinned version (supply chain protection)
+            pinned_package = f"{SANDBOX_RUNTIME_PACKAGE}@{SANDBOX_RUNTIME_VERSION}"
+            self._cmd_prefix = ["npx", "-y", pinned_package, "--settings", path, "--"]
+        if self._cmd_prefix is not None:
+            self._cmd_prefix_str = shlex.join(self._cmd_prefix)
+
     def cleanup(self):
         """
         Clean up sandbox resources, removing immutability flags if needed.
@@ -531,43 +667,27 @@ class TypestSandbox:
             return
 
         try:
-            import platform as platform_module
-            import sys
-
             # Check if Python is shutting down
-            if sys.meta_path is None or platform_module is None:
+            if sys.meta_path is None:
                 return
 
-            system = platform_module.system()
-            if system is None:
-                return
-
-            if system == "Darwin":
+            if _IS_DARWIN:
                 # macOS: Remove uchg flag
-                subprocess.run(
-                    ["chflags", "nouchg", self.settings_file],
-                    capture_output=True,
-                    timeout=5
-                )
+                _set_immutable(self.settings_file, False)
                 eprint(f"   Cleanup: Removed macOS immutability flag from {self.settings_file}")
-            elif system == "Linux":
-                # Linux: Remove +i flag (requires root)
-                subprocess.run(
-                    ["chattr", "-i", self.settings_file],
-                    capture_output=True,
-                    timeout=5
-                )
+            elif _IS_LINUX:
                 # Release advisory lock if held
                 if self._lock_fd:
                     try:
-                        import fcntl
                         fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
                         os.close(self._lock_fd)
                         self._lock_fd = None
                     except Exception:
                         pass
+                # Linux: Remove +i flag (requires root)
+                _set_immutable(self.settings_file, False)
                 eprint(f"   Cleanup: Removed Linux immutability flag from {self.settings_file}")
-            elif system == "Windows":
+            elif _IS_WINDOWS:
                 # Windows: Remove read-only attribute and restore ACL
                 try:
                     kernel32 = ctypes.windll.kernel32
@@ -580,17 +700,12 @@ class TypestSandbox:
             self.settings_immutable = False
         except Exception as e:
             # Suppress errors during shutdown
-            import sys
             if sys.meta_path is not None:
                 eprint(f"   Warning: Could not remove immutability flag: {e}")
-                try:
-                    import platform as pm
-                    if pm and pm.system() == "Darwin":
-                        eprint(f"   You may need to manually remove: chflags nouchg {self.settings_file}")
-                    elif pm and pm.system() == "Linux":
-                        eprint(f"   You may need to manually remove: sudo chattr -i {self.settings_file}")
-                except:
-                    pass
+                if _IS_DARWIN:
+                    eprint(f"   You may need to manually remove: chflags nouchg {self.settings_file}")
+                elif _IS_LINUX:
+                    eprint(f"   You may need to manually remove: sudo chattr -i {self.settings_file}")
 
     def __del__(self):
         """Cleanup on garbage collection."""
@@ -628,37 +743,17 @@ class TypestSandbox:
         Returns:
             Wrapped command if sandboxing is active, original command otherwise
         """
-        if not self.sandboxed or not self.settings_file:
-            return command
-
-        # Convert command to list if string
-        if isinstance(command, str):
-            import shlex
-            cmd_list = shlex.split(command)
-        else:
-            cmd_list = list(command)
-
-        # Build sandboxed command using settings file
-        if self.sandbox_method == "srt-installed":
-            # Use globally installed srt
-            sandboxed = ["srt", "--settings", self.settings_file, "--"] + cmd_list
-        elif self.sandbox_method == "srt-npx":
-            # Use npx to run srt with pinned version (supply chain protection)
-            pinned_package = f"{SANDBOX_RUNTIME_PACKAGE}@{SANDBOX_RUNTIME_VERSION}"
-            sandboxed = [
-                "npx", "-y", pinned_package,
-                "--settings", self.settings_file,
-                "--"
-            ] + cmd_list
-        else:
+        if not self.sandboxed or self._cmd_prefix is None:
             return command
 
         # Return in same format as input
         if isinstance(command, str):
-            import shlex
-            return " ".join(shlex.quote(arg) for arg in sandboxed)
+            # SECURITY: Re-tokenize and quote the command, so shell operators
+            # in it (";", "|", "&&") become arguments run inside the sandbox
+            # instead of being interpreted by the outer shell
+            return f"{self._cmd_prefix_str} {shlex.join(shlex.split(command))}"
         else:
-            return sandboxed
+            return self._cmd_prefix + list(command)
 
     def run_sandboxed(
         self,
@@ -761,8 +856,7 @@ def initialize_sandbox(temp_dir: str, argv: Optional[List[str]] = None) -> bool:
         idx = argv.index("--read-allow-only")
         if idx + 1 < len(argv):
             # Paths are comma-separated
-            paths_str = argv[idx + 1]
-            read_allow_only = [p.strip() for p in paths_str.split(",") if p.strip()]
+            read_allow_only = _split_paths(argv[idx + 1])
             eprint(f"⚠️  Read whitelist mode enabled via command-line")
             eprint(f"   Allowing reads only from: {read_allow_only}")
 
@@ -784,16 +878,13 @@ def initialize_sandbox(temp_dir: str, argv: Optional[List[str]] = None) -> bool:
     sandboxed = _sandbox.initialize()
 
     # SECURITY: Fail-fast if sandbox unavailable on supported platforms
-    import platform
-    system = platform.system()
-
     if not sandboxed and not disable_sandbox:
-        if system in ("Linux", "Darwin"):  # macOS = Darwin
+        if _IS_LINUX or _IS_DARWIN:
             # Sandbox is REQUIRED on Linux/macOS
             eprint("\n" + "="*60)
             eprint("❌ FATAL: Sandboxing unavailable")
             eprint("="*60)
-            eprint(f"Platform: {system}")
+            eprint(f"Platform: {_SYSTEM}")
             eprint("Sandboxing is required on Linux/macOS for security.")
             eprint("\nPossible causes:")
             eprint("  • Node.js not installed (required for npx)")
@@ -807,7 +898,7 @@ def initialize_sandbox(temp_dir: str, argv: Optional[List[str]] = None) -> bool:
             eprint("  uvx typst-mcp --disable-sandbox")
             eprint("="*60 + "\n")
             raise RuntimeError("Sandboxing unavailable on supported platform")
-        elif system == "Windows":
+        elif _IS_WINDOWS:
             # Windows: Warn but allow (WSL2/Docker is documented solution)
             eprint("\n" + "="*60)
             eprint("⚠️  WARNING: Running without sandboxing on Windows")
@@ -893,16 +984,12 @@ def secure_copy_file(source: str, destination: str, timeout: int = 10) -> None:
         - Linux/macOS: Uses 'cp' command
         - Windows: Uses 'copy' command (falls back to 'cp' if Git Bash is available)
     """
-    import platform
-
     # Verify source exists before attempting copy
     if not os.path.exists(source):
         raise FileNotFoundError(f"Source file does not exist: {source}")
 
     # Determine which copy command to use (cross-platform)
-    system = platform.system()
-
-    if system == "Windows":
+    if _IS_WINDOWS:
         # Windows: Try 'copy' first, fall back to 'cp' (Git Bash / WSL)
         try:
             # Windows 'copy' uses backslashes
@@ -1000,10 +1087,6 @@ def secure_write_file(path: str, content: bytes, mode: int = 0o600) -> None:
         - Unix: Uses atomic rename via os.replace()
         - Windows: Uses os.replace() which is atomic on same volume
     """
-    import platform
-    import tempfile
-    import stat
-
     target_path = Path(path).absolute()
     parent_dir = target_path.parent
 
@@ -1020,7 +1103,7 @@ def secure_write_file(path: str, content: bytes, mode: int = 0o600) -> None:
     try:
         # SECURITY: Set restrictive permissions BEFORE writing
         # This prevents any window where the file exists with wrong permissions
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             os.fchmod(fd, mode)
 
         # Write content
@@ -1053,7 +1136,7 @@ def secure_write_file(path: str, content: bytes, mode: int = 0o600) -> None:
         raise RuntimeError(f"Failed atomic rename to {target_path}: {e}") from e
 
     # Verify permissions on final file (defense in depth)
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         actual_mode = stat.S_IMODE(os.stat(str(target_path)).st_mode)
         if actual_mode != mode:
             eprint(f"WARNING: File permissions mismatch. Expected {oct(mode)}, got {oct(actual_mode)}")
@@ -36,6 +36,8 @@ from .models import (
     MAX_SNIPPET_LENGTH,
     MAX_LATEX_SNIPPET_LENGTH,
     MAX_QUERY_LENGTH,
+    MAX_RESULTS,
+    MAX_PACKAGE_FILES,
 )
 
 # Use configured temp directory
@@ -58,6 +60,7 @@ _docs_state = {
     "building": False,
     "error": None,
     "docs": None,
+    "chapters": None,  # Chapter index (route + content_length), built on first use
     "lock": None,  # Lazy initialize to avoid race condition at module import
 }
 
@@ -82,9 +85,6 @@ _telemetry = {
 # Import package cache from package_docs module (single source of truth)
 from .package_docs import _package_cache
 
-# Maximum results for list/search operations
-MAX_RESULTS = 1000
-
 
 def check_dependencies():
     """Check if required external tools are available."""
@@ -260,6 +260,28 @@ def list_child_routes(chapter: dict) -> list[dict]:
     return child_routes
 
 
+def get_chapter_index(typst_docs: list) -> list[dict]:
+    """
+    Returns the flat list of all chapters with their routes and sizes.
+
+    Computing content lengths serializes every chapter subtree, so the
+    index is built once per loaded docs and reused afterwards.
+    """
+    cached = _docs_state["chapters"]
+    if cached is not None and cached[0] is typst_docs:
+        return cached[1]
+
+    chapters = []
+    for chapter in typst_docs:
+        chapters.append(
+            {"route": chapter["route"], "content_length": len(json.dumps(chapter))}
+        )
+        chapters += list_child_routes(chapter)
+
+    _docs_state["chapters"] = (typst_docs, chapters)
+    return chapters
+
+
 # Removed create_pdf_resource - now using File type from fastmcp.utilities.types
 
 
@@ -336,12 +358,7 @@ async def list_docs_chapters(ctx: Context) -> str:
         await ctx.error(f"Documentation not available: {e}")
         return json.dumps({"error": str(e)})
 
-    chapters = []
-    for chapter in typst_docs:
-        chapters.append(
-            {"route": chapter["route"], "content_length": len(json.dumps(chapter))}
-        )
-        chapters += list_child_routes(chapter)
+    chapters = get_chapter_index(typst_docs)
 
     await ctx.info(f"Found {len(chapters)} documentation chapters")
     return json.dumps(chapters)
@@ -1355,12 +1372,7 @@ async def list_docs_chapters_resource(ctx: Context) -> str:
         await ctx.error(f"Documentation not available: {e}")
         raise  # Raise instead of returning JSON error
 
-    chapters = []
-    for chapter in typst_docs:
-        chapters.append(
-            {"route": chapter["route"], "content_length": len(json.dumps(chapter))}
-        )
-        chapters += list_child_routes(chapter)
+    chapters = get_chapter_index(typst_docs)
 
     await ctx.info(f"Returning {len(chapters)} chapters")
     return json.dumps(chapters, indent=2)
@@ -1444,49 +1456,41 @@ async def get_cached_package_resource(package_name: str, version: str, ctx: Cont
     await ctx.debug(f"Accessing package resource: {package_name}@{version}")
 
     try:
-        from .package_docs import get_cached_package_docs, build_package_docs
+        from .package_docs import (
+            get_cached_package_summary,
+            build_package_docs,
+            summarize_package_docs,
+        )
 
-        # Try cache first
-        docs = get_cached_package_docs(package_name, version)
+        # Try cache first (summaries are stored next to the full docs, so
+        # browsing does not load the full documentation)
+        cached = await anyio.to_thread.run_sync(
+            lambda: get_cached_package_summary(package_name, version)
+        )
 
         # Auto-fetch if not cached (WebDAV-like pattern)
-        if docs is None:
+        if cached is None:
             await ctx.info(f"Auto-fetching {package_name}@{version} (not cached)")
 
             # Run in thread pool (network I/O)
             docs = await anyio.to_thread.run_sync(
                 lambda: build_package_docs(package_name, version, timeout=30)
             )
+            cached = summarize_package_docs(docs)
 
         # Return summary by default (resources are for browsing)
         summary = {
-            "package": docs["package"],
-            "version": docs["version"],
-            "metadata": docs["metadata"],
-            "readme_preview": docs["readme"][:500] + "..."
-            if docs.get("readme") and len(docs["readme"]) > 500
-            else docs.get("readme"),
-            "examples_count": len(docs.get("examples") or []),
-            "docs_count": len(docs.get("docs") or {}),
-            "examples_list": [
-                {
-                    "filename": ex["filename"],
-                    "size": ex["size"],
-                    "path": f"examples/{ex['filename']}",
-                }
-                for ex in (docs.get("examples") or [])
-            ]
-            if docs.get("examples")
-            else [],
-            "docs_list": [
-                {"filename": name, "size": len(content), "path": f"docs/{name}"}
-                for name, content in (docs.get("docs") or {}).items()
-            ]
-            if docs.get("docs")
-            else [],
-            "import_statement": docs["import_statement"],
-            "universe_url": docs["universe_url"],
-            "homepage_url": docs.get("homepage_url"),
+            "package": cached["package"],
+            "version": cached["version"],
+            "metadata": cached["metadata"],
+            "readme_preview": cached["readme_preview"],
+            "examples_count": len(cached["examples_list"]),
+            "docs_count": len(cached["docs_list"]),
+            "examples_list": cached["examples_list"],
+            "docs_list": cached["docs_list"],
+            "import_statement": cached["import_statement"],
+            "universe_url": cached["universe_url"],
+            "homepage_url": cached.get("homepage_url"),
             "note": "Use get_package_docs() or get_package_file() tools for full content",
         }
 
@@ -1989,46 +1993,21 @@ async def get_package_docs(
     await ctx.debug(f"Fetching docs: {package_name}@{version}, summary={summary}")
 
     try:
-        from .package_docs import build_package_docs
+        from .package_docs import build_package_docs, build_package_summary
+
+        if summary:
+            # Summaries only need previews and listings, not full file contents
+            summary_docs = await anyio.to_thread.run_sync(
+                lambda: build_package_summary(package_name, version)
+            )
+            await ctx.info(f"Returning summary for {package_name}@{summary_docs['version']}")
+            return summary_docs
 
         # Run in thread pool (network I/O)
         docs = await anyio.to_thread.run_sync(
             lambda: build_package_docs(package_name, version, timeout=30)
         )
 
-        if summary:
-            # Return lightweight summary
-            await ctx.info(f"Returning summary for {package_name}@{docs['version']}")
-            return {
-                "package": docs["package"],
-                "version": docs["version"],
-                "metadata": docs["metadata"],
-                "readme_preview": docs["readme"][:500] + "..."
-                if docs.get("readme") and len(docs["readme"]) > 500
-                else docs.get("readme"),
-                "readme_full_size": len(docs["readme"]) if docs.get("readme") else 0,
-                "license_type": docs["license"][:100] if docs.get("license") else None,
-                "has_changelog": docs.get("changelog") is not None,
-                "examples_list": [
-                    {
-                        "filename": ex["filename"],
-                        "size": ex["size"],
-                        "path": f"examples/{ex['filename']}",
-                    }
-                    for ex in (docs.get("examples") or [])
-                ],
-                "docs_list": [
-                    {"filename": name, "size": len(content), "path": f"docs/{name}"}
-                    for name, content in (docs.get("docs") or {}).items()
-                ],
-                "import_statement": docs["import_statement"],
-                "universe_url": docs["universe_url"],
-                "github_url": docs["github_url"],
-                "homepage_url": docs.get("homepage_url"),
-                "repository_url": docs.get("repository_url"),
-                "note": "Use summary=false for full content, or get_package_file() for specific files",
-            }
-
         await ctx.info(f"Returning full docs for {package_name}@{docs['version']}")
         return docs
 
@@ -2103,6 +2082,72 @@ async def get_package_file(package_name: str, version: str, file_path: str, ctx:
         raise ToolError(f"Failed to fetch package file: {e}") from e
 
 
+@mcp.tool()
+async def get_package_files(
+    package_name: str, version: str, file_paths: list[str], ctx: Context
+) -> dict:
+    """Fetch several files from a Typst package in one call.
+
+    Downloads the package once and returns all requested files, instead of
+    one get_package_file() round trip per file. Files that cannot be found
+    are reported individually without failing the whole call.
+
+    Args:
+        package_name: Package name (e.g., "cetz")
+        version: Package version (e.g., "0.2.2")
+        file_paths: Paths within package (e.g., ["examples/plot.typ", "docs/guide.md"])
+        ctx: MCP context for logging
+
+    Returns:
+        Dictionary with the content of each requested file
+
+    Raises:
+        ToolError: If inputs are invalid or too many files are requested
+
+    Example:
+        Input: package_name="cetz", version="0.2.2", file_paths=["README.md", "examples/plot.typ"]
+        Output: {"package": "cetz", "version": "0.2.2", "files": [{"file_path": "README.md", "content": "..."}, ...]}
+    """
+    _telemetry["tool_calls"]["get_package_files"] += 1
+    await ctx.debug(f"Fetching {len(file_paths)} files from {package_name}@{version}")
+
+    if not file_paths:
+        raise ToolError("file_paths must contain at least one path")
+    if len(file_paths) > MAX_PACKAGE_FILES:
+        _telemetry["errors"]["get_package_files"] += 1
+        raise ToolError(
+            f"Too many files requested: {len(file_paths)} (max {MAX_PACKAGE_FILES})"
+        )
+
+    try:
+        from .package_docs import fetch_package_files
+
+        # Run in thread pool (network I/O)
+        contents = await anyio.to_thread.run_sync(
+            lambda: fetch_package_files(package_name, version, file_paths, timeout=30)
+        )
+
+        files = []
+        for path, content in contents.items():
+            if content is None:
+                await ctx.warning(f"File '{path}' not found in {package_name}@{version}")
+                files.append({"file_path": path, "error": "File not found"})
+            else:
+                files.append({"file_path": path, "content": content, "size": len(content)})
+
+        await ctx.info(f"Fetched {len(files)} files from {package_name}@{version}")
+        return {
+            "package": package_name,
+            "version": version,
+            "files": files,
+        }
+
+    except Exception as e:
+        _telemetry["errors"]["get_package_files"] += 1
+        await ctx.error(f"Failed to fetch files: {e}")
+        raise ToolError(f"Failed to fetch package files: {e}") from e
+
+
 @mcp.prompt()
 def create_typst_document_prompt(document_type: str, requirements: str = ""):
     """
@@ -2435,6 +2480,20 @@ async def async_main():
 
     asyncio.create_task(build_docs_task())
 
+    # Optionally warm the package docs cache while the server is idle
+    if typst_settings.prefetch:
+        async def prefetch_packages_task():
+            """Prefetch popular package docs without blocking server startup."""
+            from .package_docs import prefetch_packages
+
+            try:
+                warmed = await anyio.to_thread.run_sync(prefetch_packages)
+                logger.info(f"✓ Prefetched package docs: {', '.join(warmed) or 'none'}")
+            except Exception as e:
+                logger.error(f"Package prefetch failed: {e}")
+
+        asyncio.create_task(prefetch_packages_task())
+
     # Run the server asynchronously
     await mcp.run_async()
 
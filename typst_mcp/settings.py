@@ -5,7 +5,7 @@ import tempfile
 from pathlib import Path
 from typing import Annotated
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -80,6 +80,13 @@ class TypstSettings(BaseSettings):
         ),
     ] = 30
 
+    prefetch: Annotated[
+        bool,
+        Field(
+            description="Warm the package docs cache for popular packages on server startup",
+        ),
+    ] = False
+
     package_search_max_results: Annotated[
         int,
         Field(
@@ -150,8 +157,21 @@ class TypstSettings(BaseSettings):
         ),
     ] = False
 
+    # Resolved cache directory (created on first get_cache_dir() call)
+    _resolved_cache_dir: Path | None = PrivateAttr(default=None)
+
     def get_cache_dir(self) -> Path:
-        """Get the cache directory, using platform default if not configured."""
+        """Get the cache directory, using platform default if not configured.
+
+        The directory is resolved and created once; later calls return the
+        remembered path without touching the filesystem.
+        """
+        if self._resolved_cache_dir is None:
+            self._resolved_cache_dir = self._resolve_cache_dir()
+        return self._resolved_cache_dir
+
+    def _resolve_cache_dir(self) -> Path:
+        """Resolve and create the cache directory."""
         if self.cache_dir:
             cache_dir = self.cache_dir.expanduser()
             cache_dir.mkdir(parents=True, exist_ok=True)